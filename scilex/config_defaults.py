@@ -173,6 +173,11 @@ DEFAULT_COLLECT_ENABLED = True
 """Enable collection phase by default.
 Set to False to skip collection and only aggregate existing data."""
 
+DEFAULT_MAX_COLLECT_WORKERS = None
+"""Maximum number of collection worker threads (one API per worker).
+None (default) runs every API at once; each is paced by its own rate limit.
+With a cap, remaining APIs start as soon as another API's worker finishes."""
+
 DEFAULT_SEMANTIC_SCHOLAR_MODE = "regular"
 """Semantic Scholar API endpoint mode.
 Options: 'regular' (default, recommended) or 'bulk' (requires special access)."""
@@ -5,11 +5,12 @@ This module centralizes commonly used constants and provides helper functions
 for consistent data validation across the codebase.
 """
 
-import pandas as pd
-
 # Missing value indicator
 MISSING_VALUE = "NA"
 
+# Suffix of a collected page file still being written (renamed once complete)
+PARTIAL_PAGE_SUFFIX = ".tmp"
+
 
 # Circuit breaker configuration
 class CircuitBreakerConfig:
@@ -28,6 +29,12 @@ class RateLimitBackoffConfig:
     DEFAULT_BASE_WAIT = 2
     DEFAULT_USE_EXPONENTIAL = True
 
+    # Upper bound on a server-provided Retry-After delay (seconds)
+    MAX_RETRY_AFTER = 300
+
+    # Random jitter added to computed exponential waits (seconds)
+    MAX_JITTER = 1.0
+
     # API-specific configurations
     # Format: {api_name: (base_wait_seconds, use_exponential_backoff)}
     API_SPECIFIC = {
@@ -93,8 +100,16 @@ def is_valid(value) -> bool:
         >>> is_valid(pd.NA)
         False
     """
-    if pd.isna(value):
+    # Strings and None are the common cases and need no pandas check; pandas
+    # is imported on first use so that importing this module (e.g. from the
+    # collectors) does not pull it in
+    if value is None:
         return False
+    if not isinstance(value, str):
+        import pandas as pd
+
+        if pd.isna(value):
+            return False
 
     str_value = str(value).strip()
     return str_value != "" and str_value.upper() != MISSING_VALUE.upper()
@@ -17,7 +17,7 @@ from multiprocessing import cpu_count
 import pandas as pd
 from tqdm import tqdm
 
-from scilex.constants import is_valid
+from scilex.constants import PARTIAL_PAGE_SUFFIX, is_valid
 
 # ============================================================================
 # HELPER FUNCTIONS: FILESYSTEM DISCOVERY & QUERY RECONSTRUCTION
@@ -278,6 +278,9 @@ def parallel_load_all_files(
 
             # Collect all files in this directory
             for filename in os.listdir(query_dir):
+                # Skip pages an interrupted collection never finished writing
+                if filename.endswith(PARTIAL_PAGE_SUFFIX):
+                    continue
                 file_path = os.path.join(query_dir, filename)
 
                 if os.path.isfile(file_path):
@@ -12,9 +12,12 @@ States:
 
 import logging
 import threading
+import time
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+
+logger = logging.getLogger(__name__)
 
 
 class CircuitState(Enum):
@@ -25,18 +28,44 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if endpoint recovered
 
 
+# Internal state codes: plain ints keep the hot-path comparisons cheap; the
+# CircuitState enum is only built at the public boundary (state, get_stats)
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATES = (CircuitState.CLOSED, CircuitState.OPEN, CircuitState.HALF_OPEN)
+_STATE_NAMES = tuple(state.value for state in _STATES)
+
+
 class CircuitBreaker:
     """
     Circuit breaker for API calls with failure threshold and timeout.
 
-    Thread-safe implementation using locks.
+    Thread-safe: state changes happen under a lock, while the hot-path reads
+    (is_available on a closed circuit, state, failure_count) rely on single
+    attribute loads being atomic and take no lock.
     """
 
+    # One breaker per API is read on every request: slots keep attribute
+    # access cheap and drop the per-instance __dict__
+    __slots__ = (
+        "failure_threshold",
+        "timeout_seconds",
+        "name",
+        "_now",
+        "_lock",
+        "_state",
+        "_failure_count",
+        "_open_until_mono",
+        "_last_failure_iso",
+        "_success_count",
+        "_static_stats",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
         timeout_seconds: int = 60,
         name: str = "default",
+        time_func: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize circuit breaker.
@@ -45,151 +74,181 @@ class CircuitBreaker:
             failure_threshold: Number of consecutive failures before opening circuit
             timeout_seconds: Seconds to wait before attempting half-open state
             name: Name for this circuit (for logging)
+            time_func: Monotonic clock in seconds used for the timeout (e.g. a
+                cheaper coarse clock, or a fake one in tests)
         """
         self.failure_threshold = failure_threshold
         self.timeout_seconds = timeout_seconds
         self.name = name
+        self._now = time_func
 
         # State tracking (thread-safe)
         self._lock = threading.Lock()
-        self._state = CircuitState.CLOSED
+        self._state = _CLOSED
         self._failure_count = 0
-        self._last_failure_time: datetime | None = None
+        # Monotonic deadline until which an OPEN circuit blocks requests;
+        # wall-clock time of the last failure is only kept (as ISO text) for stats
+        self._open_until_mono = 0.0
+        self._last_failure_iso: str | None = None
         self._success_count = 0
 
+        # Configuration part of get_stats(), built once
+        self._static_stats = {
+            "name": name,
+            "failure_threshold": failure_threshold,
+            "timeout_seconds": timeout_seconds,
+        }
+
     @property
     def state(self) -> CircuitState:
-        """Get current circuit state (thread-safe)."""
-        with self._lock:
-            return self._state
+        """Get current circuit state (a single attribute read, no lock needed)."""
+        return _STATES[self._state]
 
     @property
     def failure_count(self) -> int:
-        """Get current failure count (thread-safe)."""
+        """Get current failure count (a single attribute read, no lock needed)."""
+        return self._failure_count
+
+    def _try_transition(self, expected: int, new: int) -> bool:
+        """
+        Atomically move from `expected` to `new` state.
+
+        Args:
+            expected: State code (_CLOSED, _OPEN, _HALF_OPEN) the circuit
+                must currently be in
+            new: State code to move to
+
+        Returns:
+            True if this call performed the transition, False if the state had
+            already changed (e.g. another thread got there first)
+        """
         with self._lock:
-            return self._failure_count
+            if self._state != expected:
+                return False
+            self._state = new
+            return True
 
     def is_available(self) -> bool:
         """
         Check if circuit allows requests.
 
+        The common CLOSED/HALF_OPEN case is decided from one unlocked read of
+        the state; the lock is only taken for the OPEN -> HALF_OPEN transition.
+
         Returns:
             True if request can proceed, False if circuit is open
         """
-        with self._lock:
-            # CLOSED: Always allow
-            if self._state == CircuitState.CLOSED:
-                return True
-
-            # HALF_OPEN: Allow (testing recovery)
-            if self._state == CircuitState.HALF_OPEN:
-                return True
-
-            # OPEN: Check if timeout expired
-            if self._state == CircuitState.OPEN:
-                if self._last_failure_time is None:
-                    return False
-
-                time_since_failure = datetime.now() - self._last_failure_time
-                if time_since_failure.total_seconds() >= self.timeout_seconds:
-                    # Timeout expired, transition to HALF_OPEN for test
-                    logging.info(
-                        f"Circuit breaker '{self.name}': Timeout expired, "
-                        f"transitioning to HALF_OPEN for recovery test"
-                    )
-                    self._state = CircuitState.HALF_OPEN
-                    return True
-
-                # Still in timeout period
-                return False
+        # CLOSED: Always allow. HALF_OPEN: Allow (testing recovery)
+        if self._state != _OPEN:
+            return True
 
+        # OPEN: Check if timeout expired
+        if self._now() < self._open_until_mono:
+            # Still in timeout period
             return False
 
+        # Timeout expired, transition to HALF_OPEN for test
+        if self._try_transition(_OPEN, _HALF_OPEN):
+            logger.info(
+                "Circuit breaker '%s': Timeout expired, "
+                "transitioning to HALF_OPEN for recovery test",
+                self.name,
+            )
+            return True
+
+        # Another thread changed the state first; go by the state it left
+        return self._state != _OPEN
+
     def record_success(self):
         """Record successful API call."""
+        # Transitions are decided under the lock and logged after releasing it
         with self._lock:
             self._failure_count = 0  # Reset failure counter
 
-            if self._state == CircuitState.HALF_OPEN:
+            recovered = self._state == _HALF_OPEN
+            if recovered:
                 # Recovery test succeeded, close circuit
-                logging.info(
-                    f"Circuit breaker '{self.name}': Recovery test successful, "
-                    f"closing circuit"
-                )
-                self._state = CircuitState.CLOSED
+                self._state = _CLOSED
                 self._success_count += 1
 
+        if recovered:
+            logger.info(
+                "Circuit breaker '%s': Recovery test successful, closing circuit",
+                self.name,
+            )
+
     def record_failure(self):
         """Record failed API call."""
+        transition = None
+        # Format the timestamp here, outside the lock, so get_stats only reads it
+        failed_at = datetime.now().isoformat()
         with self._lock:
             self._failure_count += 1
-            self._last_failure_time = datetime.now()
+            failure_count = self._failure_count
+            self._open_until_mono = self._now() + self.timeout_seconds
+            self._last_failure_iso = failed_at
 
-            if self._state == CircuitState.HALF_OPEN:
+            if self._state == _HALF_OPEN:
                 # Recovery test failed, re-open circuit
-                logging.warning(
-                    f"Circuit breaker '{self.name}': Recovery test failed, "
-                    f"re-opening circuit"
-                )
-                self._state = CircuitState.OPEN
-                return
-
-            if self._state == CircuitState.CLOSED:
-                if self._failure_count >= self.failure_threshold:
-                    # Threshold reached, open circuit
-                    logging.warning(
-                        f"Circuit breaker '{self.name}': Failure threshold reached "
-                        f"({self._failure_count} consecutive failures), OPENING CIRCUIT"
-                    )
-                    logging.warning(
-                        f"Circuit breaker '{self.name}': Will retry after "
-                        f"{self.timeout_seconds}s timeout"
-                    )
-                    self._state = CircuitState.OPEN
+                self._state = _OPEN
+                transition = "reopened"
+            elif self._state == _CLOSED and failure_count >= self.failure_threshold:
+                # Threshold reached, open circuit
+                self._state = _OPEN
+                transition = "opened"
+
+        if transition == "reopened":
+            logger.warning(
+                "Circuit breaker '%s': Recovery test failed, re-opening circuit",
+                self.name,
+            )
+        elif transition == "opened":
+            logger.warning(
+                "Circuit breaker '%s': Failure threshold reached "
+                "(%d consecutive failures), OPENING CIRCUIT",
+                self.name,
+                failure_count,
+            )
+            logger.warning(
+                "Circuit breaker '%s': Will retry after %ss timeout",
+                self.name,
+                self.timeout_seconds,
+            )
 
     def reset(self):
         """Manually reset circuit breaker to closed state."""
         with self._lock:
-            logging.info(f"Circuit breaker '{self.name}': Manual reset to CLOSED")
-            self._state = CircuitState.CLOSED
+            self._state = _CLOSED
             self._failure_count = 0
-            self._last_failure_time = None
+            self._open_until_mono = 0.0
+            self._last_failure_iso = None
+        logger.info("Circuit breaker '%s': Manual reset to CLOSED", self.name)
 
     def get_stats(self) -> dict:
         """Get circuit breaker statistics."""
+        stats = self._static_stats.copy()
         with self._lock:
-            return {
-                "name": self.name,
-                "state": self._state.value,
-                "failure_count": self._failure_count,
-                "success_count": self._success_count,
-                "last_failure_time": self._last_failure_time.isoformat()
-                if self._last_failure_time
-                else None,
-                "failure_threshold": self.failure_threshold,
-                "timeout_seconds": self.timeout_seconds,
-            }
+            stats["state"] = _STATE_NAMES[self._state]
+            stats["failure_count"] = self._failure_count
+            stats["success_count"] = self._success_count
+            stats["last_failure_time"] = self._last_failure_iso
+        return stats
 
 
 class CircuitBreakerRegistry:
     """
     Global registry for circuit breakers (one per API).
 
-    Thread-safe singleton pattern.
+    Thread-safe. Use get_registry() for the process-wide instance shared by
+    all collectors.
     """
 
-    _instance: Optional["CircuitBreakerRegistry"] = None
-    _lock = threading.Lock()
+    __slots__ = ("_breakers", "_registry_lock")
 
-    def __new__(cls):
-        """Singleton pattern."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._breakers: dict[str, CircuitBreaker] = {}
-                    cls._instance._registry_lock = threading.Lock()
-        return cls._instance
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._registry_lock = threading.Lock()
 
     def get_breaker(
         self, api_name: str, failure_threshold: int = 5, timeout_seconds: int = 60
@@ -205,6 +264,11 @@ class CircuitBreakerRegistry:
         Returns:
             CircuitBreaker instance
         """
+        # Fast path: breakers are never removed, so an unlocked hit is final
+        breaker = self._breakers.get(api_name)
+        if breaker is not None:
+            return breaker
+
         with self._registry_lock:
             if api_name not in self._breakers:
                 self._breakers[api_name] = CircuitBreaker(
@@ -212,24 +276,61 @@ class CircuitBreakerRegistry:
                     timeout_seconds=timeout_seconds,
                     name=api_name,
                 )
-                logging.debug(
-                    f"Created circuit breaker for '{api_name}' "
-                    f"(threshold={failure_threshold}, timeout={timeout_seconds}s)"
+                logger.debug(
+                    "Created circuit breaker for '%s' (threshold=%d, timeout=%ss)",
+                    api_name,
+                    failure_threshold,
+                    timeout_seconds,
                 )
             return self._breakers[api_name]
 
+    def preload(
+        self,
+        api_names: Iterable[str],
+        failure_threshold: int = 5,
+        timeout_seconds: int = 60,
+    ):
+        """
+        Create breakers for known APIs up front.
+
+        Called before collection workers start, so their lookups always hit
+        get_breaker's lock-free fast path. Existing breakers are kept as is.
+
+        Args:
+            api_names: Names of the APIs about to be queried
+            failure_threshold: Number of consecutive failures before opening
+            timeout_seconds: Seconds to wait before retry
+        """
+        for api_name in api_names:
+            self.get_breaker(api_name, failure_threshold, timeout_seconds)
+
     def get_all_stats(self) -> dict[str, dict]:
         """Get statistics for all circuit breakers."""
+        # Snapshot under the registry lock, then take each breaker's own lock
+        # outside it, so a stats scan never blocks get_breaker
         with self._registry_lock:
-            return {
-                name: breaker.get_stats() for name, breaker in self._breakers.items()
-            }
+            breakers = list(self._breakers.items())
+        return {name: breaker.get_stats() for name, breaker in breakers}
 
     def reset_all(self):
         """Reset all circuit breakers."""
         with self._registry_lock:
-            for breaker in self._breakers.values():
-                breaker.reset()
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+
+_REGISTRY = CircuitBreakerRegistry()
+
+
+def get_registry() -> CircuitBreakerRegistry:
+    """
+    Get the process-wide circuit breaker registry.
+
+    Returns:
+        The CircuitBreakerRegistry shared by all collectors
+    """
+    return _REGISTRY
 
 
 class CircuitBreakerOpenError(Exception):
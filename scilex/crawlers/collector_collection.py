@@ -1,17 +1,21 @@
 import logging
 import os
-import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import product
-from queue import Queue
+from queue import Empty, Queue
 
 import yaml
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from scilex.config_defaults import DEFAULT_OUTPUT_DIR
+from scilex.config_defaults import DEFAULT_MAX_COLLECT_WORKERS, DEFAULT_OUTPUT_DIR
+from scilex.constants import PARTIAL_PAGE_SUFFIX, CircuitBreakerConfig
 
+from .circuit_breaker import get_registry
 from .collectors import (
+    API_collector,
     Arxiv_collector,
     DBLP_collector,
     Elsevier_collector,
@@ -24,6 +28,8 @@ from .collectors import (
     SemanticScholar_collector,
     Springer_collector,
 )
+from .collectors.base import redact_secrets
+from .utils import YAML_DUMPER
 
 api_collectors = {
     "DBLP": DBLP_collector,
@@ -43,6 +49,22 @@ api_collectors = {
 # Thread worker function (processes all queries for one API)
 
 
+# Placeholder values of the Elsevier institutional token that mean "not set"
+_INVALID_INST_TOKENS = frozenset({"YOUR_INSTITUTIONAL_TOKEN", "NA", "TODO", "", None})
+
+
+# Config keys each API needs to work (checked by validate_api_keys)
+_APIS_REQUIRING_KEYS = {
+    "IEEE": ("api_key",),
+    "Springer": ("api_key",),
+    "Elsevier": ("api_key", "inst_token"),
+}
+
+
+# Progress-queue message posted when a collection worker finishes or crashes
+_WORKER_DONE = object()
+
+
 def _sanitize_error_message(error_msg):
     """
     Remove sensitive information (API keys, tokens) from error messages.
@@ -53,19 +75,43 @@ def _sanitize_error_message(error_msg):
     Returns:
         str: Sanitized error message with sensitive parameters masked
     """
-    import re
+    return redact_secrets(error_msg)
+
 
-    # Replace API keys in URLs within error messages
-    error_msg = re.sub(r"([?&]api[Kk]ey=)[^&\s]+", r"\1***REDACTED***", error_msg)
-    error_msg = re.sub(r"([?&]apikey=)[^&\s]+", r"\1***REDACTED***", error_msg)
-    error_msg = re.sub(r"([?&]key=)[^&\s]+", r"\1***REDACTED***", error_msg)
-    error_msg = re.sub(r"([?&]token=)[^&\s]+", r"\1***REDACTED***", error_msg)
-    return error_msg
+def _log_worker_crash(api_name, future):
+    """Done-callback for a per-API worker: log it right away if it crashed."""
+    if not future.cancelled() and future.exception() is not None:
+        logging.error(
+            f"Worker for {api_name} crashed: "
+            f"{_sanitize_error_message(str(future.exception()))}"
+        )
 
 
-def _run_job_collects_worker(
-    api_name, collect_list, api_config, output_dir, collect_name, progress_queue
-):
+def _has_results(query_dir):
+    """
+    Check whether a query directory holds any result file.
+
+    Any file (page_* or other) counts, except a page left half-written by an
+    interrupted run. scandir stops at the first match instead of listing the
+    whole directory.
+
+    Args:
+        query_dir: Path of one query's output directory
+
+    Returns:
+        bool: True if the query has results, False otherwise
+    """
+    try:
+        with os.scandir(query_dir) as entries:
+            return any(
+                not entry.name.endswith(PARTIAL_PAGE_SUFFIX) for entry in entries
+            )
+    except OSError:
+        # Missing, not a directory, or unreadable: not complete
+        return False
+
+
+def _run_job_collects_worker(api_name, collect_list, api_cfg, repo, progress_queue):
     """
     Thread worker function for one API.
     Processes all queries for the assigned API and sends progress updates via queue.
@@ -73,81 +119,90 @@ def _run_job_collects_worker(
     Args:
         api_name: Name of the API (e.g., "SemanticScholar")
         collect_list: List of query dicts for this API
-        api_config: API configuration dict
-        output_dir: Output directory path
-        collect_name: Collection name
+        api_cfg: This API's section of the API configuration ({} if none)
+        repo: Absolute path of the collection directory
         progress_queue: Queue for sending progress updates to main thread
     """
-    # Use absolute path
-    repo = os.path.abspath(os.path.join(output_dir, collect_name))
-
-    # Process each query for this API
-    for coll_dict in collect_list:
-        data_query = coll_dict["query"]
-        query_id = data_query.get("id_collect", 0)
-        collector_class = api_collectors[api_name]
-        api_key = None
-        inst_token = None
-
-        if api_name in api_config:
-            api_key = api_config[api_name].get("api_key")
-            if api_name == "Elsevier" and "inst_token" in api_config[api_name]:
-                token_value = api_config[api_name]["inst_token"]
-                # Reject placeholder/invalid tokens
-                INVALID_TOKENS = {"YOUR_INSTITUTIONAL_TOKEN", "NA", "TODO", "", None}
-                if token_value not in INVALID_TOKENS and not (
-                    isinstance(token_value, str) and token_value.startswith("YOUR_")
-                ):
-                    inst_token = token_value
-                    logging.debug("Using institutional token for Elsevier API")
-
-        try:
-            # Initialize collector
-            if api_name == "Elsevier" and inst_token:
-                current_coll = collector_class(data_query, repo, api_key, inst_token)
-            else:
-                current_coll = collector_class(data_query, repo, api_key)
-
-            # Run collection
-            res = current_coll.runCollect()
-            articles_collected = res.get("coll_art", 0)
-
-            logging.debug(
-                f"Completed collection for {api_name} query {query_id}: {articles_collected} articles"
-            )
+    # Jobs are grouped per API, so the collector class and credentials are
+    # the same for every query of this worker
+    collector_class = api_collectors[api_name]
+    api_key = api_cfg.get("api_key")
+    inst_token = None
+    if api_name == "Elsevier" and "inst_token" in api_cfg:
+        token_value = api_cfg["inst_token"]
+        # Reject placeholder/invalid tokens
+        if token_value not in _INVALID_INST_TOKENS and not (
+            isinstance(token_value, str) and token_value.startswith("YOUR_")
+        ):
+            inst_token = token_value
+            logging.debug("Using institutional token for Elsevier API")
+
+    # One pooled HTTP session for all of this API's queries, so keep-alive
+    # connections (and TLS sessions) survive from one query to the next
+    session = API_collector.create_session()
+
+    try:
+        # Process each query for this API
+        for coll_dict in collect_list:
+            data_query = coll_dict["query"]
+            query_id = data_query.get("id_collect", 0)
+
+            try:
+                # Initialize collector
+                if api_name == "Elsevier" and inst_token:
+                    current_coll = collector_class(
+                        data_query, repo, api_key, inst_token, session=session
+                    )
+                else:
+                    current_coll = collector_class(
+                        data_query, repo, api_key, session=session
+                    )
+
+                # Run collection; leaving the block flushes any buffered pages
+                with current_coll:
+                    res = current_coll.runCollect()
+                articles_collected = res.get("coll_art", 0)
+
+                logging.debug(
+                    f"Completed collection for {api_name} query {query_id}: {articles_collected} articles"
+                )
 
-            # Send progress update to main thread via queue
-            progress_queue.put(
-                {
-                    "api": api_name,
-                    "query_id": query_id,
-                    "articles_collected": articles_collected,
-                    "success": True,
-                }
-            )
+                # Send progress update to main thread via queue
+                progress_queue.put(
+                    {
+                        "api": api_name,
+                        "query_id": query_id,
+                        "articles_collected": articles_collected,
+                        "success": True,
+                    }
+                )
 
-        except Exception as e:
-            # Sanitize error message to remove API keys
-            sanitized_error = _sanitize_error_message(str(e))
-            logging.error(
-                f"Error during collection for {api_name} query {query_id}: {sanitized_error}"
-            )
-            # Send error progress update
-            progress_queue.put(
-                {
-                    "api": api_name,
-                    "query_id": query_id,
-                    "articles_collected": 0,
-                    "success": False,
-                    "error": sanitized_error,
-                }
-            )
+            except Exception as e:
+                # Sanitize error message to remove API keys
+                sanitized_error = _sanitize_error_message(str(e))
+                logging.error(
+                    f"Error during collection for {api_name} query {query_id}: {sanitized_error}"
+                )
+                # Send error progress update
+                progress_queue.put(
+                    {
+                        "api": api_name,
+                        "query_id": query_id,
+                        "articles_collected": 0,
+                        "success": False,
+                        "error": sanitized_error,
+                    }
+                )
+    finally:
+        session.close()
 
     # Note: Rate limiting is handled per-API by individual collectors
     # using configured rate limits from api.config.yml
 
 
 class CollectCollection:
+    _repo = None  # Collection directory, cached by get_current_repo()
+
     def __init__(self, main_config, api_config):
         print("Initializing collection")
         self.main_config = main_config
@@ -157,25 +212,13 @@ class CollectCollection:
     def validate_api_keys(self):
         """Validate that required API keys are present before starting collection"""
         logger = logging.getLogger(__name__)
-        apis_requiring_keys = {
-            "IEEE": "api_key",
-            "Springer": "api_key",
-            "Elsevier": ["api_key", "inst_token"],
-        }
-
-        missing_keys = []
         apis_to_use = self.main_config.get("apis", [])
-
-        for api in apis_to_use:
-            if api in apis_requiring_keys:
-                required_keys = apis_requiring_keys[api]
-                if not isinstance(required_keys, list):
-                    required_keys = [required_keys]
-
-                api_config = self.api_config.get(api, {})
-                for key in required_keys:
-                    if not api_config.get(key):
-                        missing_keys.append(f"{api}.{key}")
+        missing_keys = [
+            f"{api}.{key}"
+            for api in apis_to_use
+            for key in _APIS_REQUIRING_KEYS.get(api, ())
+            if not self.api_config.get(api, {}).get(key)
+        ]
 
         if missing_keys:
             logger.warning(
@@ -187,8 +230,8 @@ class CollectCollection:
         return True
 
     def run_job_collects(self, collect_list):
-        for idx in range(len(collect_list)):
-            coll = collect_list[idx]
+        repo = self.get_current_repo()
+        for coll in collect_list:
             data_query = coll["query"]
             collector = api_collectors[coll["api"]]
             api_key = None
@@ -204,8 +247,6 @@ class CollectCollection:
                     inst_token = self.api_config[coll["api"]]["inst_token"]
                     logging.info("Using institutional token for Elsevier API")
 
-            repo = self.get_current_repo()
-
             # Initialize collector with institutional token if applicable
             if coll["api"] == "Elsevier" and inst_token:
                 current_coll = collector(data_query, repo, api_key, inst_token)
@@ -217,8 +258,11 @@ class CollectCollection:
             # by individual collectors using configured rate limits from api.config.yml
 
     def get_current_repo(self):
-        output_dir = self.main_config.get("output_dir", DEFAULT_OUTPUT_DIR)
-        return os.path.join(output_dir, self.main_config["collect_name"])
+        # The config doesn't change during a run, so build the path only once
+        if self._repo is None:
+            output_dir = self.main_config.get("output_dir", DEFAULT_OUTPUT_DIR)
+            self._repo = os.path.join(output_dir, self.main_config["collect_name"])
+        return self._repo
 
     def queryCompositor(self):
         """
@@ -226,94 +270,56 @@ class CollectCollection:
             list: A list of dictionaries, each representing a unique combination.
         """
 
-        # Generate all combinations of keywords from two different groups
-        keyword_combinations = []
-        two_list_k = False
+        logger = logging.getLogger(__name__)
+
+        # Query indices (id_collect and the repo/<API>/<idx> directories) are
+        # positions in the product built below; aggregation rebuilds it from
+        # config_used.yml, so config entries must be used as is, repeats included
+        keywords = self.main_config["keywords"]
+        years = self.main_config["years"]
+        apis = self.main_config["apis"]
+
+        # Keyword groups are generated lazily: one [kw1, kw2] list per pair
+        # drawn from the two groups, or one [kw] list per keyword otherwise
         #### CASE EVERYTHING OK
-        if (
-            len(self.main_config["keywords"]) == 2
-            and len(self.main_config["keywords"][0]) != 0
-            and len(self.main_config["keywords"][1]) != 0
-        ):
-            two_list_k = True
-            keyword_combinations = [
-                list(pair)
-                for pair in product(
-                    self.main_config["keywords"][0], self.main_config["keywords"][1]
-                )
-            ]
+        if len(keywords) == 2 and len(keywords[0]) != 0 and len(keywords[1]) != 0:
+            keyword_groups = (list(pair) for pair in product(keywords[0], keywords[1]))
+            n_keyword_groups = len(keywords[0]) * len(keywords[1])
         #### CASE ONLY ONE LIST
         elif (
-            len(self.main_config["keywords"]) == 2
-            and len(self.main_config["keywords"][0]) != 0
-            and len(self.main_config["keywords"][1]) == 0
-        ) or (
-            len(self.main_config["keywords"]) == 1
-            and len(self.main_config["keywords"][0]) != 0
-        ):
-            keyword_combinations = self.main_config["keywords"][0]
+            len(keywords) == 2 and len(keywords[0]) != 0 and len(keywords[1]) == 0
+        ) or (len(keywords) == 1 and len(keywords[0]) != 0):
+            keyword_groups = ([keyword] for keyword in keywords[0])
+            n_keyword_groups = len(keywords[0])
+        else:
+            keyword_groups = ()
+            n_keyword_groups = 0
 
-        logger = logging.getLogger(__name__)
-        logger.debug(f"Generated {len(keyword_combinations)} keyword combinations")
+        logger.debug(f"Generated {n_keyword_groups} keyword combinations")
 
-        # Generate all combinations using Cartesian product
-        ### ADD LETTER FIELDS
-        # combinations = product(keyword_combinations, self.years, self.apis, self.fields)
-        combinations = product(
-            keyword_combinations, self.main_config["years"], self.main_config["apis"]
-        )
-
-        # Create a list of dictionaries with the combinations
         # Include semantic_scholar_mode for SemanticScholar API
         semantic_scholar_mode = self.main_config.get("semantic_scholar_mode", "regular")
         # Get max_articles_per_query from config (default to -1 = unlimited)
         max_articles_per_query = self.main_config.get("max_articles_per_query", -1)
 
-        if two_list_k:
-            queries = []
-            for keyword_group, year, api in combinations:
-                query = {
-                    "keyword": keyword_group,
-                    "year": year,
-                    "api": api,
-                    "max_articles_per_query": max_articles_per_query,
-                }
-                # Add semantic_scholar_mode for SemanticScholar API
-                if api == "SemanticScholar":
-                    query["semantic_scholar_mode"] = semantic_scholar_mode
-                queries.append(query)
-        else:
-            queries = []
-            for keyword_group, year, api in combinations:
-                query = {
-                    "keyword": [keyword_group],
-                    "year": year,
-                    "api": api,
-                    "max_articles_per_query": max_articles_per_query,
-                }
-                # Add semantic_scholar_mode for SemanticScholar API
-                if api == "SemanticScholar":
-                    query["semantic_scholar_mode"] = semantic_scholar_mode
-                queries.append(query)
-        logger.debug(
-            f"Generated {len(queries)} total queries across {len(self.main_config['apis'])} APIs"
-        )
-        queries_by_api = {}
-        for query in queries:
-            if query["api"] not in queries_by_api:
-                queries_by_api[query["api"]] = []
-            # Preserve all query fields (max_articles_per_query, semantic_scholar_mode, etc.)
-            query_dict = {
-                "keyword": query["keyword"],
-                "year": query["year"],
-                "max_articles_per_query": query["max_articles_per_query"],
+        # Stream the keyword x year x API product straight into per-API lists
+        queries_by_api = defaultdict(list)
+        for keyword_group, year, api in product(keyword_groups, years, apis):
+            query = {
+                "keyword": keyword_group,
+                "year": year,
+                "max_articles_per_query": max_articles_per_query,
             }
-            # Add optional semantic_scholar_mode if present
-            if "semantic_scholar_mode" in query:
-                query_dict["semantic_scholar_mode"] = query["semantic_scholar_mode"]
-            queries_by_api[query["api"]].append(query_dict)
+            # Add semantic_scholar_mode for SemanticScholar API
+            if api == "SemanticScholar":
+                query["semantic_scholar_mode"] = semantic_scholar_mode
+            queries_by_api[api].append(query)
 
-        return queries_by_api
+        logger.debug(
+            f"Generated {sum(map(len, queries_by_api.values()))} total queries "
+            f"across {len(apis)} APIs"
+        )
+        return dict(queries_by_api)
 
     def init_collection_collect(self):
         """
@@ -324,15 +330,23 @@ class CollectCollection:
         """
         repo = self.get_current_repo()
 
-        # Create directory and save config snapshot on first run
-        if not os.path.isdir(repo):
-            os.makedirs(repo)
-            logging.info(f"Created collection directory: {repo}")
+        # Create directory on first run; exist_ok still fails if repo is a file
+        os.makedirs(repo, exist_ok=True)
+        logging.debug(f"Collection directory: {repo}")
 
-        # Always save/update config snapshot to ensure it's current
+        # Keep the config snapshot current, rewriting it only when it changed
         config_path = os.path.join(repo, "config_used.yml")
+        snapshot = yaml.dump(self.main_config, Dumper=YAML_DUMPER)
+        try:
+            with open(config_path) as f:
+                unchanged = f.read() == snapshot
+        except OSError:
+            unchanged = False
+        if unchanged:
+            logging.debug(f"Config snapshot unchanged: {config_path}")
+            return
         with open(config_path, "w") as f:
-            yaml.dump(self.main_config, f)
+            f.write(snapshot)
         logging.debug(f"Saved config snapshot to: {config_path}")
 
     def _query_is_complete(self, repo, api, query_idx):
@@ -347,21 +361,29 @@ class CollectCollection:
         Returns:
             bool: True if query has result files, False otherwise
         """
-        query_dir = os.path.join(repo, api, str(query_idx))
+        return _has_results(os.path.join(repo, api, str(query_idx)))
 
-        # Query is complete if directory exists and has page files
-        if not os.path.isdir(query_dir):
-            return False
+    def _completed_query_indices(self, repo, api):
+        """
+        Find which queries of one API already have result files.
+
+        One scan of the API directory replaces a _query_is_complete call (and
+        its failed lookups for not-yet-collected queries) per query.
+
+        Args:
+            repo: Collection directory path
+            api: API name (e.g., 'SemanticScholar')
 
-        # Check for page files (e.g., page_1, page_2, etc.)
+        Returns:
+            set: Names of the completed query directories (e.g. {"0", "2"})
+        """
         try:
-            files = os.listdir(query_dir)
-            # Consider complete if it has any files (page_* or other result files)
-            has_results = len(files) > 0
-            return has_results
-        except (PermissionError, OSError):
-            # If we can't read the directory, assume it's not complete
-            return False
+            with os.scandir(os.path.join(repo, api)) as entries:
+                query_dirs = [entry for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            # No API directory yet: nothing collected
+            return set()
+        return {entry.name for entry in query_dirs if _has_results(entry.path)}
 
     def create_collects_jobs(self):
         """
@@ -389,10 +411,14 @@ class CollectCollection:
         for api in queries_by_api:
             queries = queries_by_api[api]
             api_jobs = []
+            # Pre-create the API directory, so scanning it can only fail on a
+            # real error (permissions, a file in its place), which is raised
+            os.makedirs(os.path.join(repo, api), exist_ok=True)
+            completed = self._completed_query_indices(repo, api)
 
             for idx, query in enumerate(queries):
                 # Check if this query is already complete (has result files)
-                if self._query_is_complete(repo, api, idx):
+                if str(idx) in completed:
                     n_skipped += 1
                     logger.debug(f"Skipping {api} query {idx} (already has results)")
                     continue
@@ -426,100 +452,139 @@ class CollectCollection:
             )
             return
 
-        # One thread per API
-        num_threads = len(jobs_by_api)
+        # One worker per API: workers are I/O-bound and each API has its own
+        # rate limit, so all APIs run at once unless max_collect_workers caps it
         num_apis = len(jobs_by_api)
+        max_workers = self.main_config.get(
+            "max_collect_workers", DEFAULT_MAX_COLLECT_WORKERS
+        )
+        num_threads = num_apis
+        if max_workers is not None:
+            num_threads = min(num_apis, max(1, int(max_workers)))
         print(
             f"Starting collection: {n_coll} queries across {num_apis} API(s) using {num_threads} threads (1 per API)\n"
         )
 
-        # Create per-API progress tracking
+        # Create per-API progress tracking (every API is known up front, so
+        # stats are plain dicts filled in below rather than a defaultdict)
         api_progress_bars = {}
-        api_stats = defaultdict(lambda: {"completed": 0, "total": 0, "articles": 0})
+        api_stats = {}
 
         # Initialize progress bars for each API
         for api_name, api_jobs in sorted(jobs_by_api.items()):
             query_count = len(api_jobs)
-            api_stats[api_name]["total"] = query_count
+            api_stats[api_name] = {"completed": 0, "total": query_count, "articles": 0}
             api_progress_bars[api_name] = tqdm(
                 total=query_count,
                 desc=f"{api_name:20s}",
                 unit="query",
                 position=len(api_progress_bars),
                 leave=True,
+                mininterval=1.0,  # Coalesce redraws; bars share one terminal
             )
 
         # Create shared progress queue
         progress_queue = Queue()
 
-        # Extract output_dir with default
-        output_dir = self.main_config.get("output_dir", DEFAULT_OUTPUT_DIR)
-
-        # Create one thread per API
-        threads = []
-        for api_name, api_jobs in jobs_by_api.items():
-            thread = threading.Thread(
-                target=_run_job_collects_worker,
-                args=(
-                    api_name,
-                    api_jobs,
-                    self.api_config,
-                    output_dir,
-                    self.main_config["collect_name"],
-                    progress_queue,
-                ),
-                name=f"Worker-{api_name}",
+        # Resolve the collection directory once for every worker
+        abs_repo = os.path.abspath(repo)
+
+        # Create every API's circuit breaker before the workers start, so
+        # their lookups never contend on the registry lock
+        get_registry().preload(
+            jobs_by_api,
+            failure_threshold=CircuitBreakerConfig.FAILURE_THRESHOLD,
+            timeout_seconds=CircuitBreakerConfig.TIMEOUT_SECONDS,
+        )
+
+        # Dedicated, bounded pool (one worker per API, at most max_workers)
+        # rather than ad-hoc threads, so collection threads are named and
+        # never share an executor with other libraries in the process
+        executor = ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix="scilex-collector"
+        )
+        # Submit APIs with the fewest pending queries first: when there are more
+        # APIs than workers, a small API is never stuck behind a large backlog
+        api_order = sorted(jobs_by_api, key=lambda api: len(jobs_by_api[api]))
+        futures = [
+            executor.submit(
+                _run_job_collects_worker,
+                api_name,
+                jobs_by_api[api_name],
+                # Only this API's section: workers never see other credentials
+                self.api_config.get(api_name) or {},
+                abs_repo,
+                progress_queue,
             )
-            thread.start()
-            threads.append(thread)
+            for api_name in api_order
+        ]
+        for api_name, future in zip(api_order, futures, strict=True):
+            future.add_done_callback(partial(_log_worker_crash, api_name))
+            # Runs after the worker's last progress message (or its crash), so
+            # the loop below can block on the queue instead of polling futures
+            future.add_done_callback(lambda _future: progress_queue.put(_WORKER_DONE))
 
         # Monitor progress queue in main thread
-        completed_count = 0
-        total_queries = sum(len(api_jobs) for api_jobs in jobs_by_api.values())
+        workers_running = len(futures)
 
         try:
             # Redirect logging output to work with tqdm progress bars
             with logging_redirect_tqdm(loggers=[logging.root]):
-                while completed_count < total_queries:
-                    try:
-                        # Get result from queue with timeout
-                        result = progress_queue.get(timeout=0.1)
+                while workers_running:
+                    # Block for the next message, then drain whatever else
+                    # arrived meanwhile so a burst costs one bar update per API
+                    batch = [progress_queue.get()]
+                    while True:
+                        try:
+                            batch.append(progress_queue.get_nowait())
+                        except Empty:
+                            break
+
+                    updated = {}  # api_name -> queries completed in this batch
+                    for result in batch:
+                        if result is _WORKER_DONE:
+                            workers_running -= 1
+                            continue
 
                         # Update stats
                         api_name = result["api"]
-                        articles = result["articles_collected"]
-                        api_stats[api_name]["completed"] += 1
-                        api_stats[api_name]["articles"] += articles
-
-                        # Update progress bar
+                        stats = api_stats[api_name]
+                        stats["completed"] += 1
+                        stats["articles"] += result["articles_collected"]
+                        updated[api_name] = updated.get(api_name, 0) + 1
+
+                        # Log milestone when query completes
+                        completed = stats["completed"]
+                        total = stats["total"]
+                        total_articles = stats["articles"]
+
+                        # Log at 25%, 50%, 75%, and 100% completion
+                        if completed % max(1, total // 4) == 0 or completed == total:
+                            logging.debug(
+                                f"[{api_name}] Progress: {completed}/{total} queries | {total_articles} papers collected"
+                            )
+                        # Report each API as soon as it finishes, not after
+                        # the slowest API is done
+                        if completed == total:
+                            logging.info(
+                                f"[{api_name}] Complete: {total_articles} papers from {completed} queries"
+                            )
+
+                    # Update progress bars
+                    for api_name, n_done in updated.items():
                         if api_name in api_progress_bars:
                             pbar = api_progress_bars[api_name]
-                            pbar.update(1)
-                            pbar.set_postfix({"papers": api_stats[api_name]["articles"]})
-
-                            # Log milestone when query completes
-                            completed = api_stats[api_name]["completed"]
-                            total = api_stats[api_name]["total"]
-                            total_articles = api_stats[api_name]["articles"]
-
-                            # Log at 25%, 50%, 75%, and 100% completion
-                            if completed % max(1, total // 4) == 0 or completed == total:
-                                logging.debug(
-                                    f"[{api_name}] Progress: {completed}/{total} queries | {total_articles} papers collected"
-                                )
-
-                        completed_count += 1
-
-                    except Exception:
-                        # Check if all threads are done
-                        if not any(t.is_alive() for t in threads):
-                            break
-                        continue
+                            # Postfix is drawn by the update below (rate-limited
+                            # by mininterval) instead of forcing its own redraw
+                            pbar.set_postfix(
+                                {"papers": api_stats[api_name]["articles"]},
+                                refresh=False,
+                            )
+                            pbar.update(n_done)
 
         finally:
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
+            # Wait for all workers to complete (crashes are logged as they happen)
+            executor.shutdown(wait=True)
 
             # Close all progress bars
             for pbar in api_progress_bars.values():
@@ -534,9 +599,11 @@ class CollectCollection:
                 print(
                     f"{api_name:20s}: {stats['completed']:3d} queries | {stats['articles']:,} papers"
                 )
-                logging.info(
-                    f"[{api_name}] Complete: {stats['articles']} papers from {stats['completed']} queries"
-                )
+                if stats["completed"] < stats["total"]:
+                    logging.warning(
+                        f"[{api_name}] Incomplete: {stats['articles']} papers from "
+                        f"{stats['completed']}/{stats['total']} queries"
+                    )
             print("=" * 60 + "\n")
 
         # FIRST ATTEMPT > not ordered by api > could lead to ratelimit overload
@@ -14,8 +14,8 @@ class Arxiv_collector(API_collector):
     and processes the results from the Arxiv API.
     """
 
-    def __init__(self, filter_param, data_path, api_key):
-        super().__init__(filter_param, data_path, api_key)
+    def __init__(self, filter_param, data_path, api_key, session=None):
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.max_by_page = 500  # Maximum results per page
         self.api_name = "Arxiv"
         self.api_url = "http://export.arxiv.org/api/query"
@@ -1,19 +1,63 @@
+import functools
 import json
 import logging
 import math
 import os
+import random
+import re
 import time
-from datetime import date
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import requests
 import yaml
 
 from scilex.config_defaults import get_rate_limit
-from scilex.constants import CircuitBreakerConfig, RateLimitBackoffConfig
-from scilex.crawlers.circuit_breaker import (
-    CircuitBreakerOpenError,
-    CircuitBreakerRegistry,
+from scilex.constants import (
+    PARTIAL_PAGE_SUFFIX,
+    CircuitBreakerConfig,
+    RateLimitBackoffConfig,
 )
+from scilex.crawlers.circuit_breaker import CircuitBreakerOpenError, get_registry
+from scilex.crawlers.rate_limiter import get_limiter_registry
+from scilex.crawlers.utils import YAML_LOADER
+
+# Query parameters whose values are credentials (apiKey, apikey, api_key, key, token)
+_SECRET_PARAM_RE = re.compile(r"([?&](?:api[Kk]ey|api_key|key|token)=)[^&\s]+")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_api_config(config_path, mtime_ns):
+    """
+    Parse an API config file, reusing the result while the file is unchanged.
+
+    A collector is built for every query, so without the cache the same YAML
+    would be parsed once per query. The returned dict is shared: don't mutate it.
+
+    Args:
+        config_path: Path of the YAML config file
+        mtime_ns: Modification time of the file (part of the cache key, so an
+            edited file is parsed again)
+
+    Returns:
+        dict: Parsed YAML content
+    """
+    with open(config_path) as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def redact_secrets(text):
+    """
+    Mask credential query parameters (API keys, tokens) in a URL or message.
+
+    Args:
+        text: URL or free-form text (e.g. an exception message) that may
+            contain URLs with sensitive parameters
+
+    Returns:
+        str: Text with sensitive parameter values replaced by ***REDACTED***
+    """
+    return _SECRET_PARAM_RE.sub(r"\1***REDACTED***", text)
 
 
 class Filter_param:
@@ -42,7 +86,16 @@ class Filter_param:
 class API_collector:
     # Default rate limits (fallback if config not available)
 
-    def __init__(self, data_query, data_path, api_key):
+    # Whether close_session() closes self.session (False when it was shared)
+    _owns_session = True
+
+    # Circuit breaker for this API, fetched lazily by _get_breaker()
+    _breaker = None
+
+    # Rate limiter for this API, fetched lazily by _get_limiter()
+    _limiter = None
+
+    def __init__(self, data_query, data_path, api_key, session=None):
         self.api_key = api_key
         self.api_name = "None"
         self.filter_param = Filter_param(
@@ -53,7 +106,6 @@ class API_collector:
             ),  # Default to -1 (unlimited) if not in config
         )
         self.rate_limit = 10  # Will be overridden by load_rate_limit_from_config()
-        self._last_call_time = 0.0  # For rate limiting via _rate_limit_wait()
         self.datadir = data_path
         self.collectId = data_query["id_collect"]
         self.total_art = int(data_query["total_art"])
@@ -64,8 +116,24 @@ class API_collector:
         self.api_url = ""
         self.state = data_query["state"]
 
-        # Connection pooling: Create persistent session for better performance
-        self.session = requests.Session()
+        # Connection pooling: reuse the caller's session (shared by all queries
+        # of one API) or create a persistent one for this collector
+        self._owns_session = session is None
+        self.session = self.create_session() if session is None else session
+
+        # Batch file I/O: Buffer results before writing to reduce disk I/O
+        self._result_buffer = []
+        self._buffer_size = 10  # Write every 10 pages
+
+    @staticmethod
+    def create_session():
+        """
+        Create a pooled HTTP session with keep-alive enabled.
+
+        Returns:
+            requests.Session: Session with connection pooling configured.
+        """
+        session = requests.Session()
         # Configure keep-alive and connection pooling
         adapter = requests.adapters.HTTPAdapter(
             pool_connections=10,
@@ -73,38 +141,52 @@ class API_collector:
             max_retries=0,  # We handle retries manually
             pool_block=False,
         )
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Batch file I/O: Buffer results before writing to reduce disk I/O
-        self._result_buffer = []
-        self._buffer_size = 10  # Write every 10 pages
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def close_session(self):
-        """Close the HTTP session and release connections."""
+        """Close the HTTP session and release connections.
+
+        A session passed in by the caller is left open for the caller to close.
+        """
         # Flush any remaining buffered results
-        if hasattr(self, "_result_buffer") and self._result_buffer:
-            self._flush_buffer()
+        self._flush_buffer()
 
         # Close HTTP session
-        if hasattr(self, "session") and self.session:
+        if self._owns_session:
             self.session.close()
             logging.debug(f"{self.api_name}: Session closed")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Flush buffered pages and release the session, even on error."""
+        self.close_session()
+        return False
+
     def _rate_limit_wait(self):
         """Enforce minimum interval between API calls.
 
-        Uses time.monotonic() to track elapsed time since the last call
-        and sleeps if needed to respect the configured rate limit.
+        The pacing state lives in a per-API limiter shared by every collector
+        instance, so back-to-back queries against the same API keep respecting
+        the configured rate limit instead of each starting from scratch.
         """
         if self.rate_limit <= 0:
             return
-        min_interval = 1.0 / self.rate_limit
-        now = time.monotonic()
-        elapsed = now - self._last_call_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_call_time = time.monotonic()
+        self._get_limiter().wait(self.rate_limit)
+
+    def _get_limiter(self):
+        """
+        Return this API's rate limiter, looked up once per collector.
+
+        Returns:
+            RateLimiter instance for self.api_name
+        """
+        if self._limiter is None:
+            self._limiter = get_limiter_registry().get_limiter(self.api_name)
+        return self._limiter
 
     def load_rate_limit_from_config(self):
         """
@@ -121,8 +203,7 @@ class API_collector:
             )
 
             if os.path.exists(config_path):
-                with open(config_path) as f:
-                    config = yaml.safe_load(f)
+                config = _load_api_config(config_path, os.stat(config_path).st_mtime_ns)
 
                 if (
                     config
@@ -202,10 +283,14 @@ class API_collector:
         self.lastpage = lastpage
 
     def createCollectDir(self):
-        if not os.path.isdir(self.get_apiDir()):
-            os.makedirs(self.get_apiDir())
-        if not os.path.isdir(self.get_collectDir()):
-            os.makedirs(self.get_collectDir())
+        """Create this query's output directory (and its API directory).
+
+        Returns:
+            str: Path of the collect directory.
+        """
+        collect_dir = self.get_collectDir()
+        os.makedirs(collect_dir, exist_ok=True)
+        return collect_dir
 
     def get_collectId(self):
         return self.collectId
@@ -233,16 +318,17 @@ class API_collector:
         if not self._result_buffer:
             return
 
-        self.createCollectDir()
-        logging.debug(
-            f"Flushing {len(self._result_buffer)} pages to {self.get_collectDir()}"
-        )
+        collect_dir = self.createCollectDir()
+        logging.debug(f"Flushing {len(self._result_buffer)} pages to {collect_dir}")
 
         for page, global_data in self._result_buffer:
-            with open(
-                self.get_collectDir() + "/page_" + str(page), "w", encoding="utf8"
-            ) as json_file:
+            page_path = os.path.join(collect_dir, f"page_{page}")
+            tmp_path = f"{page_path}{PARTIAL_PAGE_SUFFIX}"
+            # Write beside the target and rename into place, so an interrupted
+            # run never leaves a truncated page that looks like a finished one
+            with open(tmp_path, "w", encoding="utf8") as json_file:
                 json.dump(global_data, json_file)
+            os.replace(tmp_path, page_path)
 
         self._result_buffer.clear()
 
@@ -344,15 +430,78 @@ class API_collector:
         Returns:
             str: Sanitized URL with sensitive parameters masked
         """
-        import re
+        return redact_secrets(url)
+
+    @staticmethod
+    def _backoff_delay(attempt, base_wait=1):
+        """
+        Exponential backoff delay with random jitter.
 
-        # Replace API keys in query parameters
-        url = re.sub(r"([?&]api[Kk]ey=)[^&]+", r"\1***REDACTED***", url)
-        url = re.sub(r"([?&]apikey=)[^&]+", r"\1***REDACTED***", url)
-        url = re.sub(r"([?&]api_key=)[^&]+", r"\1***REDACTED***", url)
-        url = re.sub(r"([?&]key=)[^&]+", r"\1***REDACTED***", url)
-        url = re.sub(r"([?&]token=)[^&]+", r"\1***REDACTED***", url)
-        return url
+        The jitter spreads out retries from workers that failed at the same
+        moment (e.g. during a provider outage) instead of retrying in lockstep.
+
+        Args:
+            attempt: Zero-based retry attempt number
+            base_wait: Delay for the first attempt, in seconds
+
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        delay = base_wait * (2**attempt)
+        return round(delay + random.uniform(0, RateLimitBackoffConfig.MAX_JITTER), 2)
+
+    @staticmethod
+    def _parse_retry_after(response):
+        """
+        Read the Retry-After header of a throttled/unavailable response.
+
+        Supports both forms allowed by RFC 9110: delay in seconds and HTTP-date.
+
+        Args:
+            response: The HTTP response (may be None)
+
+        Returns:
+            int | None: Seconds to wait (capped at RateLimitBackoffConfig.MAX_RETRY_AFTER),
+                or None if the header is missing or unparseable
+        """
+        if response is None:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+
+        try:
+            wait_time = int(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            wait_time = math.ceil(
+                (retry_at - datetime.now(timezone.utc)).total_seconds()
+            )
+
+        return min(max(wait_time, 0), RateLimitBackoffConfig.MAX_RETRY_AFTER)
+
+    def _get_breaker(self):
+        """
+        Return this API's circuit breaker, looked up once per collector.
+
+        Every page request needs the breaker, so caching it keeps the shared
+        registry (and its lock) off the per-request path.
+
+        Returns:
+            CircuitBreaker instance for self.api_name
+        """
+        if self._breaker is None:
+            self._breaker = get_registry().get_breaker(
+                api_name=self.api_name,
+                failure_threshold=CircuitBreakerConfig.FAILURE_THRESHOLD,
+                timeout_seconds=CircuitBreakerConfig.TIMEOUT_SECONDS,
+            )
+        return self._breaker
 
     def api_call_decorator(
         self,
@@ -377,12 +526,7 @@ class API_collector:
         logging.debug(f"API Request to: {self._sanitize_url(configurated_url)}")
 
         # Get circuit breaker for this API
-        registry = CircuitBreakerRegistry()
-        breaker = registry.get_breaker(
-            api_name=self.api_name,
-            failure_threshold=CircuitBreakerConfig.FAILURE_THRESHOLD,
-            timeout_seconds=CircuitBreakerConfig.TIMEOUT_SECONDS,
-        )
+        breaker = self._get_breaker()
 
         # Check circuit breaker state
         if not breaker.is_available():
@@ -392,201 +536,210 @@ class API_collector:
             )
             raise CircuitBreakerOpenError(self.api_name, breaker.timeout_seconds)
 
-        def access_rate_limited(configurated_url):
-            last_exception = None
+        return self._request_with_retries(
+            configurated_url, breaker, max_retries=max_retries, headers=headers
+        )
 
-            for attempt in range(max_retries):
-                try:
-                    # Enforce rate limit before each request
-                    self._rate_limit_wait()
+    def _request_with_retries(self, configurated_url, breaker, max_retries, headers):
+        """
+        Send a GET request, retrying transient failures and updating the breaker.
 
-                    resp = self.session.get(
-                        configurated_url, headers=headers, timeout=30
-                    )
-                    resp.raise_for_status()
+        Args:
+            configurated_url: The URL to call
+            breaker: CircuitBreaker for this API
+            max_retries: Maximum number of retry attempts
+            headers: Optional dict of HTTP headers to include in the request
 
-                    # Log successful request with rate limit info
-                    logging.debug(
-                        f"{self.api_name} API: Request successful (attempt {attempt + 1}/{max_retries})"
-                    )
+        Returns:
+            Response object from the API
+        """
+        last_exception = None
 
-                    # Record success in circuit breaker
-                    breaker.record_success()
-
-                    return resp
-
-                except requests.exceptions.HTTPError as e:
-                    status_code = e.response.status_code
-                    last_exception = e
-
-                    if status_code == 429:  # Too Many Requests
-                        # Respect Retry-After header if provided by server
-                        retry_after = e.response.headers.get("Retry-After")
-                        if retry_after:
-                            try:
-                                wait_time = int(retry_after)
-                            except ValueError:
-                                wait_time = RateLimitBackoffConfig.DEFAULT_BASE_WAIT * (
-                                    2**attempt
-                                )
-                            logging.warning(
-                                f"{self.api_name} API rate limit exceeded (429). "
-                                f"Server Retry-After: {wait_time}s (attempt {attempt + 1}/{max_retries})"
-                            )
-                        else:
-                            # Fall back to API-specific backoff configuration
-                            base_wait, use_exponential = (
-                                RateLimitBackoffConfig.API_SPECIFIC.get(
-                                    self.api_name,
-                                    (
-                                        RateLimitBackoffConfig.DEFAULT_BASE_WAIT,
-                                        RateLimitBackoffConfig.DEFAULT_USE_EXPONENTIAL,
-                                    ),
-                                )
-                            )
-                            if use_exponential:
-                                wait_time = base_wait * (2**attempt)
-                            else:
-                                wait_time = base_wait
-                            logging.warning(
-                                f"{self.api_name} API rate limit exceeded (429). "
-                                f"Waiting {wait_time}s before retry (attempt {attempt + 1}/{max_retries}). "
-                                f"Strategy: {'exponential' if use_exponential else 'fixed'} backoff"
-                            )
-                        if attempt < max_retries - 1:
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            # Final retry failed - don't record as circuit breaker failure
-                            # Rate limits are temporary and don't indicate endpoint failure
-                            logging.warning(
-                                f"{self.api_name} API: Rate limit persists after {max_retries} retries with {wait_time}s waits. "
-                                f"Consider reducing rate_limit in api.config.yml or increasing backoff time."
-                            )
-                            raise  # Re-raise to let caller handle
-                    elif status_code in [401, 403]:  # Authentication errors
-                        # Build specific recovery guidance based on API
-                        recovery_actions = self._get_auth_recovery_actions(status_code)
+        for attempt in range(max_retries):
+            try:
+                # Enforce rate limit before each request
+                self._rate_limit_wait()
 
-                        logging.error(
-                            f"{self.api_name} API authentication failed: {status_code}. "
-                            f"Recovery actions:\n{recovery_actions}"
-                        )
-                        # Record failure for circuit breaker
-                        breaker.record_failure()
-                        raise  # Don't retry auth errors
-                    elif status_code == 500:  # Internal server error
-                        wait_time = 2**attempt
+                resp = self.session.get(configurated_url, headers=headers, timeout=30)
+                resp.raise_for_status()
+
+                # Log successful request with rate limit info
+                logging.debug(
+                    f"{self.api_name} API: Request successful (attempt {attempt + 1}/{max_retries})"
+                )
+
+                # Record success in circuit breaker
+                breaker.record_success()
+
+                return resp
+
+            except requests.exceptions.HTTPError as e:
+                status_code = e.response.status_code
+                last_exception = e
+
+                if status_code == 429:  # Too Many Requests
+                    # Respect Retry-After header if provided by server
+                    wait_time = self._parse_retry_after(e.response)
+                    if wait_time is not None:
                         logging.warning(
-                            f"{self.api_name} API internal server error (500). "
-                            f"This may indicate API overload or rate limiting. "
-                            f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
+                            f"{self.api_name} API rate limit exceeded (429). "
+                            f"Server Retry-After: {wait_time}s (attempt {attempt + 1}/{max_retries})"
                         )
-                        if attempt < max_retries - 1:
-                            time.sleep(wait_time)
-                            breaker.record_failure()  # Track failure for circuit breaker
-                            continue
-                        else:
-                            logging.error(
-                                f"{self.api_name} API: 500 errors persisting after {max_retries} retries. "
-                                f"Consider checking API status or reducing concurrency."
+                    else:
+                        # Fall back to API-specific backoff configuration
+                        base_wait, use_exponential = (
+                            RateLimitBackoffConfig.API_SPECIFIC.get(
+                                self.api_name,
+                                (
+                                    RateLimitBackoffConfig.DEFAULT_BASE_WAIT,
+                                    RateLimitBackoffConfig.DEFAULT_USE_EXPONENTIAL,
+                                ),
                             )
-                            breaker.record_failure()
-                            raise
-                    elif status_code in [502, 503, 504]:  # Gateway/service errors
-                        wait_time = 2**attempt
-                        logging.warning(
-                            f"{self.api_name} API gateway/service error ({status_code}). "
-                            f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
                         )
-                        if attempt < max_retries - 1:
-                            time.sleep(wait_time)
-                            breaker.record_failure()  # Track failure for circuit breaker
-                            continue
+                        if use_exponential:
+                            wait_time = self._backoff_delay(attempt, base_wait)
                         else:
-                            breaker.record_failure()
-                            raise
-                    elif status_code >= 500:  # Other 5xx errors
-                        wait_time = 2**attempt
+                            wait_time = base_wait
                         logging.warning(
-                            f"{self.api_name} API server error: {status_code}. "
-                            f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
+                            f"{self.api_name} API rate limit exceeded (429). "
+                            f"Waiting {wait_time}s before retry (attempt {attempt + 1}/{max_retries}). "
+                            f"Strategy: {'exponential' if use_exponential else 'fixed'} backoff"
                         )
-                        if attempt < max_retries - 1:
-                            time.sleep(wait_time)
-                            breaker.record_failure()  # Track failure for circuit breaker
-                            continue
-                        else:
-                            breaker.record_failure()
-                            raise
+                    if attempt < max_retries - 1:
+                        time.sleep(wait_time)
+                        continue
                     else:
-                        logging.error(
-                            f"{self.api_name} API HTTP error {status_code}: {str(e)}"
+                        # Final retry failed - don't record as circuit breaker failure
+                        # Rate limits are temporary and don't indicate endpoint failure
+                        logging.warning(
+                            f"{self.api_name} API: Rate limit persists after {max_retries} retries with {wait_time}s waits. "
+                            f"Consider reducing rate_limit in api.config.yml or increasing backoff time."
                         )
-                        # Record failure for circuit breaker
-                        breaker.record_failure()
-                        raise
+                        raise  # Re-raise to let caller handle
+                elif status_code in [401, 403]:  # Authentication errors
+                    # Build specific recovery guidance based on API
+                    recovery_actions = self._get_auth_recovery_actions(status_code)
 
-                except requests.exceptions.Timeout as e:
-                    last_exception = e
-                    wait_time = 2**attempt
+                    logging.error(
+                        f"{self.api_name} API authentication failed: {status_code}. "
+                        f"Recovery actions:\n{recovery_actions}"
+                    )
+                    # Record failure for circuit breaker
+                    breaker.record_failure()
+                    raise  # Don't retry auth errors
+                elif status_code == 500:  # Internal server error
+                    wait_time = self._backoff_delay(attempt)
                     logging.warning(
-                        f"{self.api_name} API request timeout. "
+                        f"{self.api_name} API internal server error (500). "
+                        f"This may indicate API overload or rate limiting. "
                         f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
                     )
                     if attempt < max_retries - 1:
                         time.sleep(wait_time)
+                        breaker.record_failure()  # Track failure for circuit breaker
                         continue
                     else:
                         logging.error(
-                            f"{self.api_name} API: All retry attempts failed due to timeout"
+                            f"{self.api_name} API: 500 errors persisting after {max_retries} retries. "
+                            f"Consider checking API status or reducing concurrency."
                         )
-                        # Record failure for circuit breaker
                         breaker.record_failure()
                         raise
-
-                except requests.exceptions.ConnectionError as e:
-                    last_exception = e
-                    wait_time = 2**attempt
+                elif status_code in [502, 503, 504]:  # Gateway/service errors
+                    # 503 responses often carry Retry-After (maintenance, overload)
+                    wait_time = self._parse_retry_after(e.response)
+                    if wait_time is None:
+                        wait_time = self._backoff_delay(attempt)
                     logging.warning(
-                        f"{self.api_name} API connection error. "
+                        f"{self.api_name} API gateway/service error ({status_code}). "
                         f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
                     )
                     if attempt < max_retries - 1:
                         time.sleep(wait_time)
+                        breaker.record_failure()  # Track failure for circuit breaker
                         continue
                     else:
-                        logging.error(
-                            f"{self.api_name} API: All retry attempts failed due to connection error"
-                        )
-                        # Record failure for circuit breaker
                         breaker.record_failure()
                         raise
-
-                except requests.exceptions.RequestException as e:
-                    last_exception = e
-                    logging.error(
-                        f"{self.api_name} API request failed: {str(e)}. "
-                        f"Attempt {attempt + 1}/{max_retries}"
+                elif status_code >= 500:  # Other 5xx errors
+                    wait_time = self._backoff_delay(attempt)
+                    logging.warning(
+                        f"{self.api_name} API server error: {status_code}. "
+                        f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
                     )
                     if attempt < max_retries - 1:
-                        time.sleep(2**attempt)
+                        time.sleep(wait_time)
+                        breaker.record_failure()  # Track failure for circuit breaker
                         continue
                     else:
-                        # Record failure for circuit breaker
                         breaker.record_failure()
                         raise
+                else:
+                    logging.error(
+                        f"{self.api_name} API HTTP error {status_code}: {str(e)}"
+                    )
+                    # Record failure for circuit breaker
+                    breaker.record_failure()
+                    raise
 
-            # If we exhausted all retries, raise the last exception
-            if last_exception:
-                logging.error(
-                    f"{self.api_name} API: All {max_retries} retry attempts exhausted"
+            except requests.exceptions.Timeout as e:
+                last_exception = e
+                wait_time = self._backoff_delay(attempt)
+                logging.warning(
+                    f"{self.api_name} API request timeout. "
+                    f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
+                )
+                if attempt < max_retries - 1:
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    logging.error(
+                        f"{self.api_name} API: All retry attempts failed due to timeout"
+                    )
+                    # Record failure for circuit breaker
+                    breaker.record_failure()
+                    raise
+
+            except requests.exceptions.ConnectionError as e:
+                last_exception = e
+                wait_time = self._backoff_delay(attempt)
+                logging.warning(
+                    f"{self.api_name} API connection error. "
+                    f"Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
                 )
-                # Record failure for circuit breaker
-                breaker.record_failure()
-                raise last_exception
+                if attempt < max_retries - 1:
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    logging.error(
+                        f"{self.api_name} API: All retry attempts failed due to connection error"
+                    )
+                    # Record failure for circuit breaker
+                    breaker.record_failure()
+                    raise
 
-        return access_rate_limited(configurated_url)
+            except requests.exceptions.RequestException as e:
+                last_exception = e
+                logging.error(
+                    f"{self.api_name} API request failed: {str(e)}. "
+                    f"Attempt {attempt + 1}/{max_retries}"
+                )
+                if attempt < max_retries - 1:
+                    time.sleep(self._backoff_delay(attempt))
+                    continue
+                else:
+                    # Record failure for circuit breaker
+                    breaker.record_failure()
+                    raise
+
+        # If we exhausted all retries, raise the last exception
+        if last_exception:
+            logging.error(
+                f"{self.api_name} API: All {max_retries} retry attempts exhausted"
+            )
+            # Record failure for circuit breaker
+            breaker.record_failure()
+            raise last_exception
 
     def toZotero():
         pass
@@ -625,62 +778,37 @@ class API_collector:
         from .springer import Springer_collector
 
         if isinstance(self, Springer_collector):
-            # If this is a Springer collector, use the 'collect_from_endpoints' method
+            # If this is a Springer collector, stream pages from both endpoints
+            # with 'iter_endpoint_pages'
             logging.info("Running collection for Springer data.")
 
             try:
-                combined_results = (
-                    self.collect_from_endpoints()
-                )  # Collect results from Springer endpoints
-
-                for page_data in combined_results:
-                    # PRE-CHECK: Stop if we've already collected enough articles
-                    max_articles = self.filter_param.get_max_articles_per_query()
-                    if max_articles > 0 and self.nb_art_collected >= max_articles:
-                        logging.info(
-                            f"Reached max_articles_per_query limit ({max_articles}). "
-                            f"Already collected {self.nb_art_collected} articles. Skipping remaining pages."
-                        )
-                        break
-
+                # Pages are streamed: each one is saved as soon as it is fetched.
+                # The endpoint iterator owns article counting and the
+                # max_articles_per_query cut-off.
+                for page_data in self.iter_endpoint_pages():
                     # Save each page's results
                     self.savePageResults(page_data, page)
-                    self.nb_art_collected += len(page_data["results"])
 
                     # Update the last page collected
                     self.set_lastpage(int(page) + 1)
-
-                    # Check if more pages are available based on results
-                    if (
-                        len(page_data["results"]) > 0
-                        and "total" in page_data
-                        and page_data["total"] > 0
-                    ):
-                        # Calculate expected pages based on total results
-                        expected_pages = math.ceil(
-                            page_data["total"] / self.get_max_by_page()
-                        )
-                        has_more_pages = page < expected_pages
-
-                        # Check if we've collected enough articles
-                        max_articles = self.filter_param.get_max_articles_per_query()
-                        if max_articles > 0 and self.nb_art_collected >= max_articles:
-                            logging.debug(
-                                f"Collected {self.nb_art_collected} articles (limit: {max_articles}). "
-                                f"No more pages needed."
-                            )
-                            has_more_pages = False
-                    else:
-                        has_more_pages = False
-
                     page = self.get_lastpage()  # Update the current page number
 
-                    # Check if total results are within the limit
-                    fewer_than_10k_results = page_data["total"] <= 10000
+                    state_data["last_page"] = page
+                    state_data["coll_art"] += len(page_data["results"])
                     logging.debug(
                         f"Processed page {page}: {len(page_data['results'])} results. Total found: {page_data['total']}"
                     )
 
+                if self.failed_endpoints:
+                    # Pages already fetched are kept; the query directory has
+                    # results, so the next run skips it like any other query
+                    logging.warning(
+                        f"{self.failed_endpoints} Springer endpoint(s) stopped on an error; "
+                        f"their remaining pages are missing from query {self.get_collectId()}"
+                    )
+                has_more_pages = False
+
             except Exception as e:
                 # Log additional context about the error
                 logging.error(
@@ -691,6 +819,10 @@ class API_collector:
         else:
             # If this is a DBLP collector, follow the normal process
 
+            # The query URL only changes by its offset from page to page, so
+            # build (and encode) it once for the whole query
+            url_template = self.get_configurated_url()
+
             while has_more_pages and fewer_than_10k_results:
                 # PRE-CHECK: Stop if we've already collected enough articles
                 max_articles = self.filter_param.get_max_articles_per_query()
@@ -703,9 +835,7 @@ class API_collector:
 
                 offset = self.get_offset(page)  # Calculate the current offset
 
-                url = self.get_configurated_url().format(
-                    offset
-                )  # Construct the API URL
+                url = url_template.format(offset)  # Construct the API URL
 
                 logging.debug(f"Fetching data from URL: {url}")
 
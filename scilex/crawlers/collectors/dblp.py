@@ -7,7 +7,7 @@ from .base import API_collector
 class DBLP_collector(API_collector):
     """Class to collect publication data from the DBLP API."""
 
-    def __init__(self, filter_param, data_path, api_key):
+    def __init__(self, filter_param, data_path, api_key, session=None):
         """
         Initializes the DBLP collector with the given parameters.
 
@@ -15,8 +15,10 @@ class DBLP_collector(API_collector):
             filter_param (Filter_param): The parameters for filtering results (years, keywords, etc.).
             save (int): Flag indicating whether to save the collected data.
             data_path (str): Path to save the collected data.
+            session (requests.Session, optional): Shared HTTP session; a new one is
+                created when omitted.
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.max_by_page = 1000  # Maximum number of results to retrieve per page
         self.api_name = "DBLP"
         self.api_url = "https://dblp.org/search/publ/api"
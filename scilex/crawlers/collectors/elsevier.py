@@ -9,7 +9,7 @@ from .base import API_collector
 class Elsevier_collector(API_collector):
     """Store file metadata from Elsevier API."""
 
-    def __init__(self, filter_param, data_path, api_key, inst_token=None):
+    def __init__(self, filter_param, data_path, api_key, inst_token=None, session=None):
         """
         Initialize Elsevier Scopus API collector.
 
@@ -18,14 +18,23 @@ class Elsevier_collector(API_collector):
             data_path: Path for saving data
             api_key: Elsevier API key (required)
             inst_token: Institutional token for enhanced access (optional but recommended)
+            session: Shared requests.Session (optional, a new one is created when omitted)
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.max_by_page = 25  # Scopus API max is 25 per page
         self.api_name = "Elsevier"
         self.api_url = "https://api.elsevier.com/content/search/scopus"
         self.inst_token = inst_token
         self.load_rate_limit_from_config()
+
+        # Auth headers are the same for every page, so build them once
+        self.request_headers = {
+            "X-ELS-APIKey": self.get_apikey(),
+            "Accept": "application/json",
+        }
+        # Add institutional token if available (provides better access)
         if self.inst_token:
+            self.request_headers["X-ELS-Insttoken"] = self.inst_token
             logging.debug(
                 "Initialized Elsevier collector WITH institutional token (enhanced access)"
             )
@@ -48,15 +57,8 @@ class Elsevier_collector(API_collector):
         Returns:
             Response object from the API
         """
-        headers = {"X-ELS-APIKey": self.get_apikey(), "Accept": "application/json"}
-
-        # Add institutional token if available (provides better access)
-        if self.inst_token:
-            headers["X-ELS-Insttoken"] = self.inst_token
-            logging.debug("Using institutional token for Elsevier API request")
-
         return super().api_call_decorator(
-            configurated_url, max_retries=max_retries, headers=headers
+            configurated_url, max_retries=max_retries, headers=self.request_headers
         )
 
     def parsePageResults(self, response, page):
@@ -7,7 +7,7 @@ from .base import API_collector
 class HAL_collector(API_collector):
     """Collector for fetching publication metadata from the HAL API."""
 
-    def __init__(self, filter_param, data_path, api_key):
+    def __init__(self, filter_param, data_path, api_key, session=None):
         """
         Initializes the HAL collector with the given parameters.
 
@@ -15,8 +15,10 @@ class HAL_collector(API_collector):
             filter_param (Filter_param): The parameters for filtering results (years, keywords, etc.).
             save (int): Flag indicating whether to save the collected data.
             data_path (str): Path to save the collected data.
+            session (requests.Session, optional): Shared HTTP session; a new one is
+                created when omitted.
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.max_by_page = 500  # Maximum number of results to retrieve per page
         self.api_name = "HAL"
         self.api_url = "http://api.archives-ouvertes.fr/search/"
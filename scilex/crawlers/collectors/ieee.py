@@ -10,7 +10,7 @@ class IEEE_collector(API_collector):
     Collector for fetching publication metadata from the IEEE Xplore API.
     """
 
-    def __init__(self, filter_param, data_path, api_key):
+    def __init__(self, filter_param, data_path, api_key, session=None):
         """
         Initializes the IEEE collector with the given parameters.
 
@@ -18,8 +18,10 @@ class IEEE_collector(API_collector):
             filter_param (Filter_param): The parameters for filtering results (years, keywords, etc.).
             save (int): Flag indicating whether to save the collected data.
             data_path (str): Path to save the collected data.
+            session (requests.Session, optional): Shared HTTP session; a new one is
+                created when omitted.
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.api_name = "IEEE"
         # Rate limit will be loaded from config or use DEFAULT_RATE_LIMITS (2.0 req/sec)
         self.max_by_page = (
@@ -7,8 +7,8 @@ from .base import API_collector
 class Istex_collector(API_collector):
     """Collector for fetching publication metadata from the Istex API."""
 
-    def __init__(self, filter_param, data_path, api_key):
-        super().__init__(filter_param, data_path, api_key)
+    def __init__(self, filter_param, data_path, api_key, session=None):
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.max_by_page = 500  # Maximum number of results to retrieve per page
         self.api_name = "Istex"
         self.api_url = "https://api.istex.fr/document/"
@@ -7,7 +7,7 @@ from .base import API_collector
 class OpenAlex_collector(API_collector):
     """Class to collect publication data from the OpenAlex API."""
 
-    def __init__(self, filter_param, data_path, api_key):
+    def __init__(self, filter_param, data_path, api_key, session=None):
         """Initialize the OpenAlex collector with the given parameters.
 
         Args:
@@ -15,8 +15,10 @@ class OpenAlex_collector(API_collector):
             data_path (str): Path to save the collected data.
             api_key: API key from api.config.yml (free, get at openalex.org/settings/api).
                 Without key: 100 credits/day. With key: 100,000 credits/day.
+            session (requests.Session, optional): Shared HTTP session; a new one is
+                created when omitted.
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.max_by_page = 200  # Maximum number of results to retrieve per page
         self.api_name = "OpenAlex"
         self.api_url = "https://api.openalex.org/works"
@@ -51,8 +53,8 @@ class OpenAlex_collector(API_collector):
         logging.debug(f"Total results found for page {page}: {page_data['total']}")
 
         if page_data["total"] > 0:
-            for result in page_with_results.get("results", []):
-                page_data["results"].append(result)
+            # Results are stored as returned by the API: reuse the decoded list
+            page_data["results"] = page_with_results.get("results", [])
 
         return page_data, next_cursor
 
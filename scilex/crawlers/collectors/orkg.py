@@ -14,8 +14,8 @@ class ORKG_collector(API_collector):
     API documentation: https://orkg.org/api/
     """
 
-    def __init__(self, filter_param, data_path, api_key):
-        super().__init__(filter_param, data_path, api_key)
+    def __init__(self, filter_param, data_path, api_key, session=None):
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.rate_limit = 5.0
         self.max_by_page = 25
         self.api_name = "ORKG"
@@ -26,8 +26,8 @@ class PubMed_collector(API_collector):
     Automatically enriches papers with PMC PDF URLs when PMCID is available.
     """
 
-    def __init__(self, filter_param, data_path, api_key):
-        super().__init__(filter_param, data_path, api_key)
+    def __init__(self, filter_param, data_path, api_key, session=None):
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.api_name = "PubMed"
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
         self.max_by_page = 100  # ESearch maximum retmax
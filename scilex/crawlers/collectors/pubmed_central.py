@@ -24,8 +24,8 @@ class PubMedCentral_collector(API_collector):
     Supports keyword search in title/abstract fields with date range filtering.
     """
 
-    def __init__(self, filter_param, data_path, api_key):
-        super().__init__(filter_param, data_path, api_key)
+    def __init__(self, filter_param, data_path, api_key, session=None):
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.api_name = "PubMedCentral"
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
         self.max_by_page = 100  # ESearch maximum retmax
@@ -12,7 +12,7 @@ class SemanticScholar_collector(API_collector):
     Collector for fetching publication metadata from the Semantic Scholar API.
     """
 
-    def __init__(self, filter_param, data_path, api_key):
+    def __init__(self, filter_param, data_path, api_key, session=None):
         """
         Initializes the Semantic Scholar collector with the given parameters.
 
@@ -20,8 +20,10 @@ class SemanticScholar_collector(API_collector):
             filter_param (dict): Parameters for filtering results (years, keywords, mode, etc.).
             save (int): Flag indicating whether to save the collected data.
             data_path (str): Path to save the collected data.
+            session (requests.Session, optional): Shared HTTP session; a new one is
+                created when omitted.
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.api_name = "SemanticScholar"
         self.api_url = "https://api.semanticscholar.org/graph/v1/paper/search"
 
@@ -45,6 +47,11 @@ class SemanticScholar_collector(API_collector):
         # Load rate limit from config (defaults to 1 req/sec with API key)
         self.load_rate_limit_from_config()
 
+        # Auth headers are the same for every page, so build them once
+        self.request_headers = (
+            {"x-api-key": self.get_apikey()} if self.get_apikey() else None
+        )
+
     def api_call_decorator(
         self, configurated_url, max_retries=CircuitBreakerConfig.MAX_RETRIES
     ):
@@ -59,9 +66,8 @@ class SemanticScholar_collector(API_collector):
         Returns:
             Response object from the API
         """
-        headers = {"x-api-key": self.get_apikey()} if self.get_apikey() else None
         return super().api_call_decorator(
-            configurated_url, max_retries=max_retries, headers=headers
+            configurated_url, max_retries=max_retries, headers=self.request_headers
         )
 
     def parsePageResults(self, response, page):
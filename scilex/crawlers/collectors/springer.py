@@ -8,15 +8,17 @@ from .base import API_collector
 class Springer_collector(API_collector):
     """Store file metadata from Springer API."""
 
-    def __init__(self, filter_param, data_path, api_key):
+    def __init__(self, filter_param, data_path, api_key, session=None):
         """
         Initialize the Springer Collector.
 
         Args:
             filter_param (dict): The filter parameters for the search query.
             data_path (str): Path to save the data.
+            session (requests.Session, optional): Shared HTTP session; a new one is
+                created when omitted.
         """
-        super().__init__(filter_param, data_path, api_key)
+        super().__init__(filter_param, data_path, api_key, session=session)
         self.api_name = "Springer"
         self.max_by_page = 100
         #     self.api_key = springer_api
@@ -35,6 +37,9 @@ class Springer_collector(API_collector):
         # Load rate limit from config (defaults to 1.5 req/sec for Basic tier)
         self.load_rate_limit_from_config()
 
+        # Endpoints that stopped on an error (set by iter_endpoint_pages)
+        self.failed_endpoints = 0
+
     def parsePageResults(self, response, page):
         """
         Parses the JSON response from the API for a specific page of results.
@@ -128,15 +133,19 @@ class Springer_collector(API_collector):
 
         return [meta_url, openaccess_url]
 
-    def collect_from_endpoints(self):
+    def iter_endpoint_pages(self):
         """
-        Collects data from both the meta and openaccess endpoints with pagination.
+        Fetch pages from both the meta and openaccess endpoints, yielding each
+        page as soon as it is parsed.
 
-        Returns:
-            list: Combined results from both endpoints.
+        Streaming lets the caller save a page while the next one is fetched,
+        instead of holding every page in memory until both endpoints are done.
+        Endpoints that stop on an error are counted in ``self.failed_endpoints``.
+
+        Yields:
+            dict: Parsed page data (see parsePageResults).
         """
         urls = self.get_configurated_url()  # Get the list of API URLs
-        combined_results = []
 
         for base_url in urls:  # Iterate through each base URL
             ################################# TO DO ?
@@ -165,42 +174,37 @@ class Springer_collector(API_collector):
 
                     # Parse the response
                     page_data = self.parsePageResults(response, page)
-                    combined_results.append(
-                        page_data
-                    )  # Store results from this endpoint
-
-                    # Update article count
-                    self.nb_art_collected += len(page_data["results"])
-
-                    # Determine if more pages are available
-                    if (
-                        len(page_data["results"]) > 0
-                        and "total" in page_data
-                        and page_data["total"] > 0
-                    ):
-                        # Calculate expected pages based on total results
-                        expected_pages = math.ceil(
-                            page_data["total"] / self.max_by_page
-                        )
-                        has_more_pages = page < expected_pages
-
-                        # Check if we've collected enough articles
-                        max_articles = self.filter_param.get_max_articles_per_query()
-                        if max_articles > 0 and self.nb_art_collected >= max_articles:
-                            logging.debug(
-                                f"Collected {self.nb_art_collected} articles (limit: {max_articles}). "
-                                f"No more pages needed."
-                            )
-                            has_more_pages = False
-                    else:
-                        has_more_pages = False
-
-                    page += 1  # Increment page number for the next request
-
                 except Exception as e:
                     logging.error(
-                        f"Error fetching or parsing data from {paginated_url}: {str(e)}"
+                        f"Error fetching or parsing data from {self._sanitize_url(paginated_url)}: {str(e)}"
                     )
-                    has_more_pages = False  # Stop fetching on error
+                    self.failed_endpoints += 1
+                    break  # Stop fetching this endpoint on error
+
+                # Update article count
+                self.nb_art_collected += len(page_data["results"])
+
+                # Determine if more pages are available
+                if (
+                    len(page_data["results"]) > 0
+                    and "total" in page_data
+                    and page_data["total"] > 0
+                ):
+                    # Calculate expected pages based on total results
+                    expected_pages = math.ceil(page_data["total"] / self.max_by_page)
+                    has_more_pages = page < expected_pages
+
+                    # Check if we've collected enough articles
+                    max_articles = self.filter_param.get_max_articles_per_query()
+                    if max_articles > 0 and self.nb_art_collected >= max_articles:
+                        logging.debug(
+                            f"Collected {self.nb_art_collected} articles (limit: {max_articles}). "
+                            f"No more pages needed."
+                        )
+                        has_more_pages = False
+                else:
+                    has_more_pages = False
+
+                page += 1  # Increment page number for the next request
 
-        return combined_results
+                yield page_data
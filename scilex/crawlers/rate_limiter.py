@@ -0,0 +1,132 @@
+"""
+Shared per-API rate limiting for API calls.
+
+A fresh collector is created for every query, so a rate limiter stored on the
+collector forgets the previous query's last call and lets the first request of
+the next query go out immediately. Keeping one limiter per API in a process-wide
+registry paces every request to that API, whichever collector issues it.
+
+Each limiter hands out evenly spaced time slots (1 / rate seconds apart). A
+caller reserves its slot under the lock and sleeps outside it, so concurrent
+callers queue behind each other instead of all waking at once.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Minimum-interval rate limiter shared by every caller of one API.
+
+    Thread-safe implementation using locks.
+    """
+
+    def __init__(self, name: str = "default"):
+        """
+        Initialize rate limiter.
+
+        Args:
+            name: Name for this limiter (for logging)
+        """
+        self.name = name
+
+        # Monotonic time at which the next request may be sent (thread-safe)
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def reserve(self, rate_limit: float) -> float:
+        """
+        Reserve the next request slot.
+
+        Args:
+            rate_limit: Requests per second allowed for this API (<= 0 disables)
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        if rate_limit <= 0:
+            return 0.0
+
+        min_interval = 1.0 / rate_limit
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + min_interval
+            return slot - now
+
+    def wait(self, rate_limit: float):
+        """
+        Block until the caller may send its next request.
+
+        Args:
+            rate_limit: Requests per second allowed for this API (<= 0 disables)
+        """
+        delay = self.reserve(rate_limit)
+        if delay > 0:
+            time.sleep(delay)
+
+    def reset(self):
+        """Forget previous calls so the next request goes out immediately."""
+        with self._lock:
+            self._next_allowed = 0.0
+
+
+class RateLimiterRegistry:
+    """
+    Global registry for rate limiters (one per API).
+
+    Thread-safe. Use get_limiter_registry() for the process-wide instance
+    shared by all collectors.
+    """
+
+    __slots__ = ("_limiters", "_registry_lock")
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._limiters: dict[str, RateLimiter] = {}
+        self._registry_lock = threading.Lock()
+
+    def get_limiter(self, api_name: str) -> RateLimiter:
+        """
+        Get or create rate limiter for an API.
+
+        Args:
+            api_name: API name
+
+        Returns:
+            RateLimiter instance
+        """
+        # Fast path: limiters are never removed, so an unlocked hit is final
+        limiter = self._limiters.get(api_name)
+        if limiter is not None:
+            return limiter
+
+        with self._registry_lock:
+            if api_name not in self._limiters:
+                self._limiters[api_name] = RateLimiter(name=api_name)
+                logger.debug("Created rate limiter for '%s'", api_name)
+            return self._limiters[api_name]
+
+    def reset_all(self):
+        """Reset all rate limiters."""
+        with self._registry_lock:
+            limiters = list(self._limiters.values())
+        for limiter in limiters:
+            limiter.reset()
+
+
+_REGISTRY = RateLimiterRegistry()
+
+
+def get_limiter_registry() -> RateLimiterRegistry:
+    """
+    Get the process-wide rate limiter registry.
+
+    Returns:
+        The RateLimiterRegistry shared by all collectors
+    """
+    return _REGISTRY
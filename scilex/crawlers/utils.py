@@ -3,6 +3,11 @@ import os
 
 import yaml
 
+# libyaml's C loader/dumper when PyYAML was built with it (several times
+# faster), otherwise the equivalent pure-Python safe implementations
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def load_yaml_config(file_path):
     """
@@ -18,8 +23,7 @@ def load_yaml_config(file_path):
         raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
     with open(file_path) as ymlfile:
-        return yaml.safe_load(ymlfile)
-
+        return yaml.load(ymlfile, Loader=YAML_LOADER)
 
 
 def load_all_configs(config_files):
@@ -16,7 +16,7 @@ import yaml
 
 from scilex.config_defaults import DEFAULT_COLLECT_ENABLED, DEFAULT_OUTPUT_DIR
 from scilex.crawlers.collector_collection import CollectCollection
-from scilex.crawlers.utils import load_all_configs
+from scilex.crawlers.utils import YAML_DUMPER, YAML_LOADER, load_all_configs
 from scilex.logging_config import log_section, setup_logging
 
 # Set up logging configuration with environment variable support
@@ -42,7 +42,7 @@ src_dir = os.path.dirname(os.path.abspath(__file__))
 advanced_config_path = os.path.join(src_dir, "scilex.advanced.yml")
 if os.path.isfile(advanced_config_path):
     with open(advanced_config_path) as f:
-        advanced_config = yaml.safe_load(f) or {}
+        advanced_config = yaml.load(f, Loader=YAML_LOADER) or {}
         # Merge advanced settings
         for key, value in advanced_config.items():
             if key not in main_config:
@@ -69,7 +69,7 @@ if collect:
 
         # saving the config
         with open(os.path.join(output_dir, "config_used.yml"), "w") as f:
-            yaml.dump(main_config, f)
+            yaml.dump(main_config, f, Dumper=YAML_DUMPER)
 
     path = output_dir
 
@@ -4,11 +4,14 @@ Uses __new__ to bypass __init__ and avoid filesystem/HTTP side effects.
 """
 
 import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
+from scilex.constants import RateLimitBackoffConfig
 from scilex.crawlers.circuit_breaker import CircuitBreakerOpenError
 from scilex.crawlers.collectors.base import API_collector
 
@@ -183,6 +186,13 @@ class TestSavePageResultsAndBuffer:
         written = json.loads((collect_dir / "page_0").read_text())
         assert written == data
 
+    def test_flush_leaves_no_partial_files(self, tmp_path):
+        collector = _make_collector(tmp_path=tmp_path)
+        collector._buffer_size = 1
+        collector.savePageResults({"page": 0}, page=0)
+        collect_dir = tmp_path / "TestAPI" / "0"
+        assert sorted(p.name for p in collect_dir.iterdir()) == ["page_0"]
+
     def test_flush_empty_buffer_no_error(self, tmp_path):
         collector = _make_collector(tmp_path=tmp_path)
         # Should not raise
@@ -199,7 +209,7 @@ class TestApiCallDecoratorErrorPaths:
 
     def _call(self, collector, mock_registry, **kwargs):
         with patch(
-            "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+            "scilex.crawlers.collectors.base.get_registry",
             return_value=mock_registry,
         ):
             return collector.api_call_decorator(self.URL, **kwargs)
@@ -254,7 +264,7 @@ class TestApiCallDecoratorErrorPaths:
 
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch("scilex.crawlers.collectors.base.time.sleep"),
@@ -274,7 +284,7 @@ class TestApiCallDecoratorErrorPaths:
 
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch("scilex.crawlers.collectors.base.time.sleep"),
@@ -291,7 +301,7 @@ class TestApiCallDecoratorErrorPaths:
 
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch("scilex.crawlers.collectors.base.time.sleep"),
@@ -313,7 +323,7 @@ class TestApiCallDecoratorErrorPaths:
         sleep_calls = []
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch(
@@ -339,7 +349,7 @@ class TestApiCallDecoratorErrorPaths:
         sleep_calls = []
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch(
@@ -365,7 +375,7 @@ class TestApiCallDecoratorErrorPaths:
         sleep_calls = []
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch(
@@ -378,3 +388,254 @@ class TestApiCallDecoratorErrorPaths:
         assert result is mock_success
         # DBLP uses fixed 30s wait
         assert any(s == 30 for s in sleep_calls)
+
+    def test_503_with_retry_after_header_uses_header(self):
+        collector = _make_collector()
+        mock_registry, _ = _make_mock_cb()
+        _, error = _make_http_error(503, headers={"Retry-After": "7"})
+        mock_success = MagicMock()
+        mock_success.raise_for_status.return_value = None
+        collector.session.get.side_effect = [error, mock_success]
+
+        sleep_calls = []
+        with (
+            patch(
+                "scilex.crawlers.collectors.base.get_registry",
+                return_value=mock_registry,
+            ),
+            patch(
+                "scilex.crawlers.collectors.base.time.sleep",
+                side_effect=lambda t: sleep_calls.append(t),
+            ),
+        ):
+            result = collector.api_call_decorator(self.URL, max_retries=3)
+
+        assert result is mock_success
+        assert sleep_calls == [7]
+
+
+# -------------------------------------------------------------------------
+# TestParseRetryAfter
+# -------------------------------------------------------------------------
+class TestParseRetryAfter:
+    def test_missing_header_returns_none(self):
+        response, _ = _make_http_error(429)
+        assert API_collector._parse_retry_after(response) is None
+
+    def test_seconds_value(self):
+        response, _ = _make_http_error(429, headers={"Retry-After": "12"})
+        assert API_collector._parse_retry_after(response) == 12
+
+    def test_http_date_value(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response, _ = _make_http_error(
+            503, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+        )
+        assert 28 <= API_collector._parse_retry_after(response) <= 31
+
+    def test_past_http_date_is_zero(self):
+        response, _ = _make_http_error(
+            503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert API_collector._parse_retry_after(response) == 0
+
+    def test_invalid_value_returns_none(self):
+        response, _ = _make_http_error(429, headers={"Retry-After": "soon"})
+        assert API_collector._parse_retry_after(response) is None
+
+    def test_large_value_is_capped(self):
+        response, _ = _make_http_error(429, headers={"Retry-After": "86400"})
+        assert (
+            API_collector._parse_retry_after(response)
+            == RateLimitBackoffConfig.MAX_RETRY_AFTER
+        )
+
+
+# -------------------------------------------------------------------------
+# TestSpringerRunCollect
+# -------------------------------------------------------------------------
+class TestSpringerRunCollect:
+    DATA_QUERY = {
+        "keyword": ["knowledge graph"],
+        "year": 2024,
+        "id_collect": 0,
+        "total_art": 0,
+        "coll_art": 0,
+        "last_page": 0,
+        "state": 0,
+    }
+
+    def _make_springer(self, tmp_path, pages, failed_endpoints=0):
+        from scilex.crawlers.collectors.springer import Springer_collector
+
+        collector = Springer_collector(dict(self.DATA_QUERY), str(tmp_path), "key")
+
+        def fake_iter():
+            collector.failed_endpoints = failed_endpoints
+            for page_data in pages:
+                collector.nb_art_collected += len(page_data["results"])
+                yield page_data
+
+        collector.iter_endpoint_pages = fake_iter
+        return collector
+
+    def test_no_failed_endpoints_before_collecting(self, tmp_path):
+        from scilex.crawlers.collectors.springer import Springer_collector
+
+        collector = Springer_collector(dict(self.DATA_QUERY), str(tmp_path), "key")
+        assert collector.failed_endpoints == 0
+
+    def test_pages_streamed_and_counted_once(self, tmp_path):
+        pages = [
+            {"total": 3, "results": [{"id": 1}, {"id": 2}]},
+            {"total": 1, "results": [{"id": 3}]},
+        ]
+        collector = self._make_springer(tmp_path, pages)
+
+        state = collector.runCollect()
+
+        assert state["state"] == 1
+        assert state["coll_art"] == 3
+        assert collector.nb_art_collected == 3
+        saved = sorted(p.name for p in tmp_path.rglob("page_*"))
+        assert saved == ["page_1", "page_2"]
+
+    def test_failed_endpoint_keeps_pages_and_warns(self, tmp_path):
+        pages = [{"total": 1, "results": [{"id": 1}]}]
+        collector = self._make_springer(tmp_path, pages, failed_endpoints=1)
+
+        with patch("scilex.crawlers.collectors.base.logging.warning") as warning:
+            state = collector.runCollect()
+
+        warning.assert_called_once()
+        assert state["state"] == 1
+        assert state["coll_art"] == 1
+        assert [p.name for p in tmp_path.rglob("page_*")] == ["page_1"]
+
+
+# -------------------------------------------------------------------------
+# TestPagedRunCollect
+# -------------------------------------------------------------------------
+class TestPagedRunCollect:
+    DATA_QUERY = {
+        "keyword": ["knowledge graph"],
+        "year": 2024,
+        "id_collect": 0,
+        "total_art": 0,
+        "coll_art": 0,
+        "last_page": 0,
+        "state": 0,
+    }
+
+    def test_url_template_built_once_per_query(self, tmp_path):
+        collector = API_collector(dict(self.DATA_QUERY), str(tmp_path), None)
+        collector.api_name = "TestAPI"
+        collector.max_by_page = 2
+        collector.get_configurated_url = MagicMock(
+            return_value="https://api.example.com/?q=kg&offset={}"
+        )
+        collector.api_call_decorator = MagicMock()
+        collector.log_api_usage = MagicMock()
+        collector.parsePageResults = MagicMock(
+            return_value={"total": 4, "results": [{"id": 1}, {"id": 2}]}
+        )
+
+        state = collector.runCollect()
+
+        assert state["state"] == 1
+        collector.get_configurated_url.assert_called_once()
+        urls = [call.args[0] for call in collector.api_call_decorator.call_args_list]
+        assert urls == [
+            "https://api.example.com/?q=kg&offset=0",
+            "https://api.example.com/?q=kg&offset=2",
+        ]
+
+
+# -------------------------------------------------------------------------
+# TestSessionOwnership
+# -------------------------------------------------------------------------
+class TestSessionOwnership:
+    DATA_QUERY = {
+        "keyword": ["knowledge graph"],
+        "year": 2024,
+        "id_collect": 0,
+        "total_art": 0,
+        "coll_art": 0,
+        "last_page": 0,
+        "state": 0,
+    }
+
+    def test_creates_own_session_by_default(self, tmp_path):
+        collector = API_collector(dict(self.DATA_QUERY), str(tmp_path), None)
+        assert isinstance(collector.session, requests.Session)
+        with patch.object(collector.session, "close") as mock_close:
+            collector.close_session()
+        mock_close.assert_called_once()
+
+    def test_shared_session_left_open(self, tmp_path):
+        shared = MagicMock()
+        collector = API_collector(
+            dict(self.DATA_QUERY), str(tmp_path), None, session=shared
+        )
+        assert collector.session is shared
+        collector.close_session()
+        shared.close.assert_not_called()
+
+    def test_context_manager_flushes_on_error(self, tmp_path):
+        collector = API_collector(dict(self.DATA_QUERY), str(tmp_path), None)
+        collector.api_name = "TestAPI"
+        with pytest.raises(RuntimeError), collector:
+            collector.savePageResults({"data": "test"}, page=1)
+            raise RuntimeError("boom")
+        assert collector._result_buffer == []
+        assert (tmp_path / "TestAPI" / "0" / "page_1").exists()
+
+
+# -------------------------------------------------------------------------
+# TestCreateCollectDir
+# -------------------------------------------------------------------------
+class TestCreateCollectDir:
+    def test_creates_nested_dirs_and_returns_path(self, tmp_path):
+        collector = _make_collector(tmp_path=tmp_path)
+        path = collector.createCollectDir()
+        assert path == collector.get_collectDir()
+        assert (tmp_path / "TestAPI" / "0").is_dir()
+
+    def test_existing_dir_is_fine(self, tmp_path):
+        (tmp_path / "TestAPI" / "0").mkdir(parents=True)
+        collector = _make_collector(tmp_path=tmp_path)
+        assert collector.createCollectDir() == collector.get_collectDir()
+
+
+# -------------------------------------------------------------------------
+# TestBackoffDelay
+# -------------------------------------------------------------------------
+class TestBackoffDelay:
+    def test_exponential_growth_within_jitter(self):
+        for attempt in range(4):
+            delay = API_collector._backoff_delay(attempt, base_wait=2)
+            base = 2 * (2**attempt)
+            assert base <= delay <= base + RateLimitBackoffConfig.MAX_JITTER
+
+    def test_jitter_uses_random_uniform(self):
+        with patch(
+            "scilex.crawlers.collectors.base.random.uniform", return_value=0.5
+        ) as mock_uniform:
+            assert API_collector._backoff_delay(2) == 4.5
+        mock_uniform.assert_called_once_with(0, RateLimitBackoffConfig.MAX_JITTER)
+
+
+# -------------------------------------------------------------------------
+# TestGetBreaker
+# -------------------------------------------------------------------------
+class TestGetBreaker:
+    def test_registry_consulted_once_per_collector(self):
+        collector = _make_collector()
+        mock_registry, mock_breaker = _make_mock_cb()
+        with patch(
+            "scilex.crawlers.collectors.base.get_registry",
+            return_value=mock_registry,
+        ):
+            assert collector._get_breaker() is mock_breaker
+            assert collector._get_breaker() is mock_breaker
+        mock_registry.get_breaker.assert_called_once()
@@ -1,13 +1,17 @@
 """Tests for scilex.crawlers.circuit_breaker module."""
 
-from datetime import datetime, timedelta
-from unittest.mock import patch
+import time
+from unittest.mock import MagicMock, patch
 
 from scilex.crawlers.circuit_breaker import (
+    _CLOSED,
+    _HALF_OPEN,
+    _OPEN,
     CircuitBreaker,
     CircuitBreakerOpenError,
     CircuitBreakerRegistry,
     CircuitState,
+    get_registry,
 )
 
 
@@ -28,6 +32,16 @@ class TestCircuitState:
 # -------------------------------------------------------------------------
 # CircuitBreaker
 # -------------------------------------------------------------------------
+class _FakeClock:
+    """Manually advanced clock passed as CircuitBreaker's time_func."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
 class TestCircuitBreaker:
     def test_initial_state_is_closed(self):
         cb = CircuitBreaker(name="test")
@@ -65,45 +79,88 @@ class TestCircuitBreaker:
         assert cb.is_available() is False
 
     def test_open_transitions_to_half_open_after_timeout(self):
-        cb = CircuitBreaker(failure_threshold=2, timeout_seconds=60, name="test")
+        clock = _FakeClock()
+        cb = CircuitBreaker(
+            failure_threshold=2, timeout_seconds=60, name="test", time_func=clock
+        )
         cb.record_failure()
         cb.record_failure()
         assert cb.state == CircuitState.OPEN
 
-        # Simulate timeout expiry by patching datetime.now
-        future_time = datetime.now() + timedelta(seconds=61)
-        with patch("scilex.crawlers.circuit_breaker.datetime") as mock_dt:
-            mock_dt.now.return_value = future_time
-            assert cb.is_available() is True
-            assert cb.state == CircuitState.HALF_OPEN
+        # Simulate timeout expiry by advancing the injected clock
+        clock.now += 61
+        assert cb.is_available() is True
+        assert cb.state == CircuitState.HALF_OPEN
 
     def test_half_open_success_closes_circuit(self):
-        cb = CircuitBreaker(failure_threshold=2, timeout_seconds=60, name="test")
+        clock = _FakeClock()
+        cb = CircuitBreaker(
+            failure_threshold=2, timeout_seconds=60, name="test", time_func=clock
+        )
         cb.record_failure()
         cb.record_failure()
 
         # Force to half-open
-        future_time = datetime.now() + timedelta(seconds=61)
-        with patch("scilex.crawlers.circuit_breaker.datetime") as mock_dt:
-            mock_dt.now.return_value = future_time
-            cb.is_available()  # triggers transition to HALF_OPEN
+        clock.now += 61
+        cb.is_available()  # triggers transition to HALF_OPEN
 
         cb.record_success()
         assert cb.state == CircuitState.CLOSED
 
     def test_half_open_failure_reopens_circuit(self):
-        cb = CircuitBreaker(failure_threshold=2, timeout_seconds=60, name="test")
+        clock = _FakeClock()
+        cb = CircuitBreaker(
+            failure_threshold=2, timeout_seconds=60, name="test", time_func=clock
+        )
         cb.record_failure()
         cb.record_failure()
 
-        future_time = datetime.now() + timedelta(seconds=61)
-        with patch("scilex.crawlers.circuit_breaker.datetime") as mock_dt:
-            mock_dt.now.return_value = future_time
-            cb.is_available()
+        clock.now += 61
+        cb.is_available()
 
         cb.record_failure()
         assert cb.state == CircuitState.OPEN
 
+    def test_open_within_timeout_stays_blocked(self):
+        clock = _FakeClock()
+        cb = CircuitBreaker(
+            failure_threshold=1, timeout_seconds=60, name="test", time_func=clock
+        )
+        cb.record_failure()
+        clock.now += 59
+        assert cb.is_available() is False
+        assert cb.state == CircuitState.OPEN
+
+    def test_defaults_to_monotonic_clock(self):
+        cb = CircuitBreaker(name="test")
+        assert cb._now is time.monotonic
+
+    def test_try_transition_only_from_expected_state(self):
+        cb = CircuitBreaker(name="test")
+        assert cb._try_transition(_OPEN, _HALF_OPEN) is False
+        assert cb.state == CircuitState.CLOSED
+        assert cb._try_transition(_CLOSED, _OPEN) is True
+        assert cb.state == CircuitState.OPEN
+
+    def test_uses_slots(self):
+        cb = CircuitBreaker(name="test")
+        assert not hasattr(cb, "__dict__")
+
+    def test_transitions_logged_outside_lock(self):
+        cb = CircuitBreaker(failure_threshold=1, name="test")
+        held = []
+
+        def _record(*args, **kwargs):
+            held.append(cb._lock.locked())
+
+        with patch("scilex.crawlers.circuit_breaker.logger") as mock_logger:
+            mock_logger.warning.side_effect = _record
+            mock_logger.info.side_effect = _record
+            cb.record_failure()
+            cb.reset()
+        assert held
+        assert not any(held)
+
     def test_reset(self):
         cb = CircuitBreaker(failure_threshold=2, name="test")
         cb.record_failure()
@@ -130,19 +187,33 @@ class TestCircuitBreaker:
         assert stats["failure_count"] == 1
         assert stats["last_failure_time"] is not None
 
+    def test_get_stats_returns_independent_dicts(self):
+        cb = CircuitBreaker(name="test")
+        stats = cb.get_stats()
+        stats["name"] = "changed"
+        assert cb.get_stats()["name"] == "test"
+
+    def test_get_stats_failure_time_cleared_by_reset(self):
+        cb = CircuitBreaker(name="test")
+        cb.record_failure()
+        first = cb.get_stats()["last_failure_time"]
+        assert cb.get_stats()["last_failure_time"] == first
+        cb.reset()
+        assert cb.get_stats()["last_failure_time"] is None
+
 
 # -------------------------------------------------------------------------
 # CircuitBreakerRegistry
 # -------------------------------------------------------------------------
 class TestCircuitBreakerRegistry:
-    def setup_method(self):
-        # Reset singleton for test isolation
-        CircuitBreakerRegistry._instance = None
+    def test_get_registry_returns_shared_instance(self):
+        assert get_registry() is get_registry()
+        assert isinstance(get_registry(), CircuitBreakerRegistry)
 
-    def test_singleton(self):
+    def test_instances_are_independent(self):
         r1 = CircuitBreakerRegistry()
         r2 = CircuitBreakerRegistry()
-        assert r1 is r2
+        assert r1.get_breaker("TestAPI") is not r2.get_breaker("TestAPI")
 
     def test_get_breaker_creates_new(self):
         registry = CircuitBreakerRegistry()
@@ -156,6 +227,28 @@ class TestCircuitBreakerRegistry:
         cb2 = registry.get_breaker("TestAPI")
         assert cb1 is cb2
 
+    def test_existing_breaker_returned_without_lock(self):
+        registry = CircuitBreakerRegistry()
+        cb = registry.get_breaker("TestAPI")
+        registry._registry_lock = MagicMock()
+        assert registry.get_breaker("TestAPI") is cb
+        registry._registry_lock.__enter__.assert_not_called()
+
+    def test_preload_creates_breakers(self):
+        registry = CircuitBreakerRegistry()
+        registry.preload(["API1", "API2"], failure_threshold=3, timeout_seconds=10)
+        cb = registry._breakers["API1"]
+        assert set(registry._breakers) == {"API1", "API2"}
+        assert cb.failure_threshold == 3
+        assert cb.timeout_seconds == 10
+        assert registry.get_breaker("API1") is cb
+
+    def test_preload_keeps_existing_breaker(self):
+        registry = CircuitBreakerRegistry()
+        cb = registry.get_breaker("API1")
+        registry.preload(["API1"])
+        assert registry.get_breaker("API1") is cb
+
     def test_different_apis_get_different_breakers(self):
         registry = CircuitBreakerRegistry()
         cb1 = registry.get_breaker("API1")
@@ -170,6 +263,21 @@ class TestCircuitBreakerRegistry:
         assert "API1" in stats
         assert "API2" in stats
 
+    def test_get_all_stats_releases_registry_lock_first(self):
+        registry = CircuitBreakerRegistry()
+        cb = registry.get_breaker("API1")
+        held = []
+        real_get_stats = CircuitBreaker.get_stats
+
+        def _get_stats(breaker):
+            held.append(registry._registry_lock.locked())
+            return real_get_stats(breaker)
+
+        with patch.object(CircuitBreaker, "get_stats", _get_stats):
+            stats = registry.get_all_stats()
+        assert stats["API1"]["name"] == cb.name
+        assert held == [False]
+
     def test_reset_all(self):
         registry = CircuitBreakerRegistry()
         cb = registry.get_breaker("TestAPI", failure_threshold=2)
@@ -179,10 +287,6 @@ class TestCircuitBreakerRegistry:
         registry.reset_all()
         assert cb.state == CircuitState.CLOSED
 
-    def teardown_method(self):
-        # Clean up singleton
-        CircuitBreakerRegistry._instance = None
-
 
 # -------------------------------------------------------------------------
 # CircuitBreakerOpenError
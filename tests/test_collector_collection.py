@@ -3,12 +3,22 @@
 Uses __new__ to bypass __init__ (which creates directories and writes YAML).
 """
 
+import threading
+from concurrent.futures import Future
+from queue import Queue
+from unittest.mock import patch
 
+import pytest
 
+from scilex.crawlers.aggregate_parallel import reconstruct_query_to_keywords_mapping
 from scilex.crawlers.collector_collection import (
     CollectCollection,
+    _log_worker_crash,
+    _run_job_collects_worker,
     _sanitize_error_message,
+    api_collectors,
 )
+from scilex.crawlers.collectors import API_collector
 
 
 # -------------------------------------------------------------------------
@@ -54,6 +64,12 @@ class TestSanitizeErrorMessage:
         result = _sanitize_error_message(msg)
         assert "mytoken" not in result
 
+    def test_underscore_api_key_redacted(self):
+        msg = "Error at https://api.example.com?api_key=abc123&q=ml"
+        result = _sanitize_error_message(msg)
+        assert "abc123" not in result
+        assert "q=ml" in result
+
     def test_clean_message_unchanged(self):
         msg = "Error: Connection timed out after 30 seconds"
         result = _sanitize_error_message(msg)
@@ -164,6 +180,22 @@ class TestQueryCompositor:
                 assert "max_articles_per_query" in q, f"Missing 'max_articles_per_query' in {api} query"
                 assert q["max_articles_per_query"] == 200
 
+    def test_indices_match_aggregation_mapping_with_duplicates(self):
+        config = {
+            "keywords": [["a", "a", "b"]],
+            "years": [2020, 2021],
+            "apis": ["OpenAlex"],
+            "max_articles_per_query": -1,
+        }
+        result = _make_collection(main_config=config).queryCompositor()
+        collected = {
+            str(idx): query["keyword"]
+            for idx, query in enumerate(result["OpenAlex"])
+        }
+        mapping = reconstruct_query_to_keywords_mapping(config)
+        assert collected == mapping["OpenAlex"]
+        assert collected["4"] == ["b"]
+
 
 # -------------------------------------------------------------------------
 # TestQueryIsComplete
@@ -189,6 +221,43 @@ class TestQueryIsComplete:
         result = coll._query_is_complete(str(tmp_path), "SemanticScholar", 0)
         assert result is True
 
+    def test_query_path_is_a_file_returns_false(self, tmp_path):
+        (tmp_path / "SemanticScholar").mkdir()
+        (tmp_path / "SemanticScholar" / "0").write_text("{}")
+        coll = _make_collection()
+        result = coll._query_is_complete(str(tmp_path), "SemanticScholar", 0)
+        assert result is False
+
+    def test_dir_with_only_partial_page_returns_false(self, tmp_path):
+        query_dir = tmp_path / "SemanticScholar" / "0"
+        query_dir.mkdir(parents=True)
+        (query_dir / "page_0.tmp").write_text("{")
+        coll = _make_collection()
+        result = coll._query_is_complete(str(tmp_path), "SemanticScholar", 0)
+        assert result is False
+
+
+class TestCompletedQueryIndices:
+    def test_missing_api_dir_returns_empty(self, tmp_path):
+        coll = _make_collection()
+        assert coll._completed_query_indices(str(tmp_path), "HAL") == set()
+
+    def test_only_dirs_with_results_counted(self, tmp_path):
+        api_dir = tmp_path / "HAL"
+        for name, files in {"0": ["page_1"], "1": [], "2": ["page_1.tmp"]}.items():
+            (api_dir / name).mkdir(parents=True)
+            for filename in files:
+                (api_dir / name / filename).write_text("{}")
+        (api_dir / "3").write_text("not a directory")
+        coll = _make_collection()
+        assert coll._completed_query_indices(str(tmp_path), "HAL") == {"0"}
+
+    def test_api_path_that_is_a_file_raises(self, tmp_path):
+        (tmp_path / "HAL").write_text("not a directory")
+        coll = _make_collection()
+        with pytest.raises(NotADirectoryError):
+            coll._completed_query_indices(str(tmp_path), "HAL")
+
 
 # -------------------------------------------------------------------------
 # TestValidateApiKeys
@@ -228,3 +297,232 @@ class TestValidateApiKeys:
             api_config={"IEEE": {}},  # Missing IEEE key
         )
         assert coll.validate_api_keys() is False
+
+
+# -------------------------------------------------------------------------
+# TestCreateCollectsJobs
+# -------------------------------------------------------------------------
+class _FakeCollector:
+    """Collector stand-in that records its query and reports 3 articles."""
+
+    api_name = "HAL"
+    calls = []
+    apis = []
+    sessions = []
+    repos = []
+
+    @staticmethod
+    def reset():
+        """Clear what previous runs recorded (shared with subclasses)."""
+        _FakeCollector.calls = []
+        _FakeCollector.apis = []
+        _FakeCollector.sessions = []
+        _FakeCollector.repos = []
+
+    def __init__(self, data_query, repo, api_key, *args, session=None):
+        self.data_query = data_query
+        _FakeCollector.sessions.append(session)
+        _FakeCollector.repos.append(repo)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def runCollect(self):
+        _FakeCollector.calls.append(self.data_query["id_collect"])
+        _FakeCollector.apis.append(self.api_name)
+        return {"coll_art": 3}
+
+
+class _TokenRecordingCollector(_FakeCollector):
+    """Collector stand-in that records the positional credentials it gets."""
+
+    credentials = []
+
+    def __init__(self, data_query, repo, api_key, *args, session=None):
+        super().__init__(data_query, repo, api_key, session=session)
+        _TokenRecordingCollector.credentials.append((api_key, *args))
+
+
+class TestRunJobCollectsWorker:
+    def _run(self, monkeypatch, tmp_path, elsevier_config):
+        _FakeCollector.reset()
+        _TokenRecordingCollector.credentials = []
+        monkeypatch.setitem(api_collectors, "Elsevier", _TokenRecordingCollector)
+        queue = Queue()
+        jobs = [{"query": {"id_collect": 0}}, {"query": {"id_collect": 1}}]
+        _run_job_collects_worker(
+            "Elsevier",
+            jobs,
+            elsevier_config,
+            str(tmp_path / "run"),
+            queue,
+        )
+        assert queue.qsize() == 2
+        return _TokenRecordingCollector.credentials
+
+    def test_inst_token_passed_to_every_query(self, tmp_path, monkeypatch):
+        creds = self._run(
+            monkeypatch, tmp_path, {"api_key": "k", "inst_token": "real-token"}
+        )
+        assert creds == [("k", "real-token"), ("k", "real-token")]
+
+    def test_placeholder_inst_token_ignored(self, tmp_path, monkeypatch):
+        creds = self._run(
+            monkeypatch, tmp_path, {"api_key": "k", "inst_token": "YOUR_TOKEN"}
+        )
+        assert creds == [("k",), ("k",)]
+
+
+class TestCreateCollectsJobs:
+    def setup_method(self):
+        _FakeCollector.reset()
+
+    @staticmethod
+    def _collection(tmp_path, **overrides):
+        """CollectCollection for a one-API ("HAL") run under tmp_path/run."""
+        main_config = {
+            "collect_name": "run",
+            "keywords": [["a", "b"], []],
+            "years": [2024],
+            "apis": ["HAL"],
+            "output_dir": str(tmp_path),
+            "max_articles_per_query": -1,
+        }
+        main_config.update(overrides)
+        return _make_collection(main_config=main_config)
+
+    @staticmethod
+    def _record_pool_sizes(monkeypatch):
+        """Record the max_workers of every collection thread pool created."""
+        from scilex.crawlers import collector_collection
+
+        pool_sizes = []
+        real_executor = collector_collection.ThreadPoolExecutor
+
+        def recording_executor(max_workers, **kwargs):
+            pool_sizes.append(max_workers)
+            return real_executor(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(collector_collection, "ThreadPoolExecutor", recording_executor)
+        return pool_sizes
+
+    def test_runs_every_query_on_worker_pool(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        coll = self._collection(tmp_path, years=[2023, 2024])
+        coll.create_collects_jobs()
+        assert sorted(_FakeCollector.calls) == [0, 1, 2, 3]
+
+    def test_skips_completed_queries(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        done_dir = tmp_path / "run" / "HAL" / "0"
+        done_dir.mkdir(parents=True)
+        (done_dir / "page_1").write_text("{}")
+        self._collection(tmp_path).create_collects_jobs()
+        assert _FakeCollector.calls == [1]
+
+    def test_api_dirs_created_before_scan(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        self._collection(tmp_path).create_collects_jobs()
+        assert (tmp_path / "run" / "HAL").is_dir()
+
+    def test_workers_get_absolute_repo(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        monkeypatch.chdir(tmp_path)
+        self._collection(tmp_path, output_dir="out").create_collects_jobs()
+        assert _FakeCollector.repos == [str(tmp_path / "out" / "run")] * 2
+
+    def test_progress_bar_counts_every_query(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        coll = self._collection(
+            tmp_path, keywords=[["a", "b", "c"], []], years=[2023, 2024]
+        )
+        with patch("scilex.crawlers.collector_collection.tqdm") as mock_tqdm:
+            coll.create_collects_jobs()
+        pbar = mock_tqdm.return_value
+        assert sum(call.args[0] for call in pbar.update.call_args_list) == 6
+        assert pbar.set_postfix.call_args.args[0] == {"papers": 18}
+
+    def test_returns_when_worker_crashes(self, tmp_path, monkeypatch):
+        monkeypatch.delitem(api_collectors, "HAL")
+        coll = self._collection(tmp_path, keywords=[["a"], []])
+        worker = threading.Thread(target=coll.create_collects_jobs, daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+
+    def test_worker_pool_capped_by_max_collect_workers(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        monkeypatch.setitem(api_collectors, "Arxiv", _FakeCollector)
+        pool_sizes = self._record_pool_sizes(monkeypatch)
+        coll = self._collection(
+            tmp_path,
+            keywords=[["a"], []],
+            years=[2023, 2024],
+            apis=["HAL", "Arxiv"],
+            max_collect_workers=1,
+        )
+        coll.create_collects_jobs()
+        assert pool_sizes == [1]
+        assert sorted(_FakeCollector.calls) == [0, 0, 1, 1]
+
+    def test_every_api_gets_a_worker_by_default(self, tmp_path, monkeypatch):
+        apis = [f"Fake{i}" for i in range(len(api_collectors) + 1)]
+        for api in apis:
+            monkeypatch.setitem(api_collectors, api, _FakeCollector)
+        pool_sizes = self._record_pool_sizes(monkeypatch)
+        coll = self._collection(tmp_path, keywords=[["a"], []], apis=apis)
+        coll.create_collects_jobs()
+        assert pool_sizes == [len(apis)]
+
+    def test_breakers_preloaded_for_queried_apis(self, tmp_path, monkeypatch):
+        from scilex.crawlers import collector_collection
+        from scilex.crawlers.circuit_breaker import CircuitBreakerRegistry
+
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        registry = CircuitBreakerRegistry()
+        monkeypatch.setattr(collector_collection, "get_registry", lambda: registry)
+        self._collection(tmp_path, keywords=[["a"], []]).create_collects_jobs()
+        assert set(registry._breakers) == {"HAL"}
+
+    def test_queries_of_one_api_share_a_session(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        coll = self._collection(tmp_path)
+        with patch.object(API_collector, "create_session") as mock_create:
+            coll.create_collects_jobs()
+        mock_create.assert_called_once()
+        shared = mock_create.return_value
+        assert _FakeCollector.sessions == [shared, shared]
+        shared.close.assert_called_once()
+
+    def test_smallest_backlog_scheduled_first(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(api_collectors, "HAL", _FakeCollector)
+        fake_arxiv = type("_FakeArxiv", (_FakeCollector,), {"api_name": "Arxiv"})
+        monkeypatch.setitem(api_collectors, "Arxiv", fake_arxiv)
+        # HAL has 2 pending queries, Arxiv only 1 (query 0 already done)
+        done_dir = tmp_path / "run" / "Arxiv" / "0"
+        done_dir.mkdir(parents=True)
+        (done_dir / "page_1").write_text("{}")
+        coll = self._collection(tmp_path, apis=["HAL", "Arxiv"], max_collect_workers=1)
+        coll.create_collects_jobs()
+        assert _FakeCollector.apis == ["Arxiv", "HAL", "HAL"]
+
+
+# -------------------------------------------------------------------------
+# TestLogWorkerCrash
+# -------------------------------------------------------------------------
+class TestLogWorkerCrash:
+    def test_crash_logged_with_redacted_message(self, caplog):
+        future = Future()
+        future.set_exception(RuntimeError("GET https://x.org?apiKey=SECRET failed"))
+        _log_worker_crash("HAL", future)
+        assert "Worker for HAL crashed" in caplog.text
+        assert "SECRET" not in caplog.text
+
+    def test_successful_worker_not_logged(self, caplog):
+        future = Future()
+        future.set_result(None)
+        _log_worker_crash("HAL", future)
+        assert caplog.text == ""
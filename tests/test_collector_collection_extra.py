@@ -1,5 +1,7 @@
 """Additional tests for scilex/crawlers/collector_collection.py — CollectCollection methods."""
 
+import os
+
 import pytest
 
 from scilex.crawlers.collector_collection import CollectCollection, _sanitize_error_message
@@ -116,3 +118,34 @@ class TestGetCurrentRepo:
         result = coll.get_current_repo()
         assert "my_review" in result
         assert "/tmp/out" in result
+
+    def test_path_is_computed_once(self):
+        coll = _make_collection()
+        first = coll.get_current_repo()
+        coll.main_config = {}
+        assert coll.get_current_repo() is first
+
+
+class TestInitCollectionCollect:
+    def test_snapshot_written_once_while_config_unchanged(self, tmp_path):
+        coll = _make_collection()
+        coll.main_config = {**coll.main_config, "output_dir": str(tmp_path)}
+        coll.init_collection_collect()
+        snapshot = tmp_path / "test_run" / "config_used.yml"
+        assert snapshot.exists()
+
+        os.utime(snapshot, ns=(0, 0))
+        coll.init_collection_collect()
+        assert snapshot.stat().st_mtime_ns == 0
+
+        coll.main_config["years"] = [2023]
+        coll.init_collection_collect()
+        assert snapshot.stat().st_mtime_ns != 0
+        assert "2023" in snapshot.read_text()
+
+    def test_repo_path_that_is_a_file_raises(self, tmp_path):
+        coll = _make_collection()
+        coll.main_config = {**coll.main_config, "output_dir": str(tmp_path)}
+        (tmp_path / "test_run").write_text("not a directory")
+        with pytest.raises(FileExistsError):
+            coll.init_collection_collect()
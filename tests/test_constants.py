@@ -1,5 +1,8 @@
 """Tests for scilex.constants utility functions."""
 
+import subprocess
+import sys
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -58,6 +61,15 @@ class TestIsValid:
     def test_whitespace_only_is_invalid(self):
         assert is_valid("  \t\n  ") is False
 
+    def test_import_does_not_load_pandas(self):
+        code = (
+            "import sys, scilex.constants; "
+            "assert 'pandas' not in sys.modules; "
+            "scilex.constants.is_valid(float('nan')); "
+            "assert 'pandas' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 class TestIsMissing:
     """Tests for is_missing() - inverse of is_valid()."""
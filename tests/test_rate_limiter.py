@@ -0,0 +1,94 @@
+"""Tests for scilex.crawlers.rate_limiter module."""
+
+from unittest.mock import MagicMock, patch
+
+from scilex.crawlers.rate_limiter import (
+    RateLimiter,
+    RateLimiterRegistry,
+    get_limiter_registry,
+)
+
+
+# -------------------------------------------------------------------------
+# RateLimiter
+# -------------------------------------------------------------------------
+class TestRateLimiter:
+    def test_first_reservation_is_immediate(self):
+        limiter = RateLimiter(name="test")
+        assert limiter.reserve(2.0) == 0.0
+
+    def test_reservations_are_spaced_by_interval(self):
+        limiter = RateLimiter(name="test")
+        with patch("scilex.crawlers.rate_limiter.time.monotonic", return_value=100.0):
+            assert limiter.reserve(2.0) == 0.0
+            assert limiter.reserve(2.0) == 0.5
+            assert limiter.reserve(2.0) == 1.0
+
+    def test_idle_time_is_not_banked(self):
+        limiter = RateLimiter(name="test")
+        with patch("scilex.crawlers.rate_limiter.time.monotonic", return_value=100.0):
+            limiter.reserve(1.0)
+        with patch("scilex.crawlers.rate_limiter.time.monotonic", return_value=200.0):
+            assert limiter.reserve(1.0) == 0.0
+            assert limiter.reserve(1.0) == 1.0
+
+    def test_zero_rate_limit_never_waits(self):
+        limiter = RateLimiter(name="test")
+        assert limiter.reserve(0) == 0.0
+        assert limiter.reserve(0) == 0.0
+
+    def test_wait_sleeps_for_reserved_delay(self):
+        limiter = RateLimiter(name="test")
+        with (
+            patch("scilex.crawlers.rate_limiter.time.monotonic", return_value=100.0),
+            patch("scilex.crawlers.rate_limiter.time.sleep") as mock_sleep,
+        ):
+            limiter.wait(4.0)
+            mock_sleep.assert_not_called()
+            limiter.wait(4.0)
+            mock_sleep.assert_called_once_with(0.25)
+
+    def test_reset(self):
+        limiter = RateLimiter(name="test")
+        limiter.reserve(0.1)
+        limiter.reset()
+        assert limiter.reserve(0.1) == 0.0
+
+
+# -------------------------------------------------------------------------
+# RateLimiterRegistry
+# -------------------------------------------------------------------------
+class TestRateLimiterRegistry:
+    def test_get_limiter_registry_returns_shared_instance(self):
+        assert get_limiter_registry() is get_limiter_registry()
+        assert isinstance(get_limiter_registry(), RateLimiterRegistry)
+
+    def test_instances_are_independent(self):
+        r1 = RateLimiterRegistry()
+        r2 = RateLimiterRegistry()
+        assert r1.get_limiter("TestAPI") is not r2.get_limiter("TestAPI")
+
+    def test_get_limiter_returns_same_instance(self):
+        registry = RateLimiterRegistry()
+        limiter = registry.get_limiter("TestAPI")
+        assert isinstance(limiter, RateLimiter)
+        assert limiter.name == "TestAPI"
+        assert registry.get_limiter("TestAPI") is limiter
+
+    def test_existing_limiter_returned_without_lock(self):
+        registry = RateLimiterRegistry()
+        limiter = registry.get_limiter("TestAPI")
+        registry._registry_lock = MagicMock()
+        assert registry.get_limiter("TestAPI") is limiter
+        registry._registry_lock.__enter__.assert_not_called()
+
+    def test_different_apis_get_different_limiters(self):
+        registry = RateLimiterRegistry()
+        assert registry.get_limiter("API1") is not registry.get_limiter("API2")
+
+    def test_reset_all(self):
+        registry = RateLimiterRegistry()
+        limiter = registry.get_limiter("TestAPI")
+        limiter.reserve(0.1)
+        registry.reset_all()
+        assert limiter.reserve(0.1) == 0.0
@@ -8,12 +8,15 @@ Validates:
 - Retry-After header is respected on 429
 """
 
+import os
 import time
 from unittest.mock import MagicMock, patch
 
 import requests
+import yaml
 
 from scilex.config_defaults import DEFAULT_RATE_LIMITS, get_rate_limit
+from scilex.crawlers.rate_limiter import RateLimiterRegistry
 
 # ============================================================================
 # Dual-value structure validation
@@ -124,6 +127,17 @@ def _make_collector(api_name="TestAPI", rate_limit=10.0, api_key=None):
 class TestRateLimitWait:
     """Test _rate_limit_wait() enforces minimum interval."""
 
+    def setup_method(self):
+        # Pacing state is shared per API; start each test from a fresh registry
+        self._registry_patch = patch(
+            "scilex.crawlers.collectors.base.get_limiter_registry",
+            return_value=RateLimiterRegistry(),
+        )
+        self._registry_patch.start()
+
+    def teardown_method(self):
+        self._registry_patch.stop()
+
     def test_first_call_no_wait(self):
         """First call should not wait (last_call_time=0)."""
         collector = _make_collector(rate_limit=1.0)
@@ -144,6 +158,30 @@ class TestRateLimitWait:
         # Should have waited ~100ms (allowing 50ms tolerance)
         assert elapsed >= 0.05, f"Expected >=50ms wait, got {elapsed * 1000:.0f}ms"
 
+    def test_interval_shared_across_instances(self):
+        """A new collector for the same API should not reset the pacing."""
+        _make_collector(rate_limit=10.0)._rate_limit_wait()
+        start = time.monotonic()
+        _make_collector(rate_limit=10.0)._rate_limit_wait()
+        elapsed = time.monotonic() - start
+        assert elapsed >= 0.05, f"Expected >=50ms wait, got {elapsed * 1000:.0f}ms"
+
+    def test_different_apis_not_paced_together(self):
+        """Each API has its own limiter."""
+        _make_collector(api_name="API1", rate_limit=1.0)._rate_limit_wait()
+        start = time.monotonic()
+        _make_collector(api_name="API2", rate_limit=1.0)._rate_limit_wait()
+        elapsed = time.monotonic() - start
+        assert elapsed < 0.05
+
+    def test_limiter_looked_up_once(self):
+        """The collector keeps its limiter instead of hitting the registry per call."""
+        collector = _make_collector(rate_limit=1000.0)
+        collector._rate_limit_wait()
+        with patch("scilex.crawlers.collectors.base.get_limiter_registry") as registry:
+            collector._rate_limit_wait()
+        registry.assert_not_called()
+
     def test_zero_rate_limit_skips(self):
         """rate_limit=0 should skip waiting."""
         collector = _make_collector(rate_limit=0)
@@ -193,6 +231,34 @@ rate_limits:
 
         assert collector.rate_limit == 42.0
 
+    def test_config_parsed_once_while_unchanged(self, tmp_path):
+        """Repeated collectors reuse the parsed config until the file changes."""
+        config_file = tmp_path / "api.config.yml"
+        config_file.write_text("rate_limits:\n  TestAPI: 42.0\n")
+
+        with (
+            patch(
+                "scilex.crawlers.collectors.base.os.path.join",
+                return_value=str(config_file),
+            ),
+            patch(
+                "scilex.crawlers.collectors.base.yaml.load",
+                wraps=yaml.load,
+            ) as mock_load,
+        ):
+            for _ in range(3):
+                collector = _make_collector(api_name="TestAPI", rate_limit=10.0)
+                collector.load_rate_limit_from_config()
+            assert mock_load.call_count == 1
+
+            config_file.write_text("rate_limits:\n  TestAPI: 7.0\n")
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            collector.load_rate_limit_from_config()
+
+        assert mock_load.call_count == 2
+        assert collector.rate_limit == 7.0
+
     def test_missing_config_uses_defaults(self):
         """When no config file exists, should use DEFAULT_RATE_LIMITS."""
         collector = _make_collector(
@@ -256,7 +322,7 @@ class TestRetryAfterHeader:
 
         with (
             patch(
-                "scilex.crawlers.collectors.base.CircuitBreakerRegistry",
+                "scilex.crawlers.collectors.base.get_registry",
                 return_value=mock_registry,
             ),
             patch("scilex.crawlers.collectors.base.time.sleep") as mock_sleep,
@@ -1,8 +1,9 @@
 """Tests for Semantic Scholar URL construction with pagination parameters."""
 
 import urllib.parse
+from unittest.mock import patch
 
-from scilex.crawlers.collectors import SemanticScholar_collector
+from scilex.crawlers.collectors import API_collector, SemanticScholar_collector
 
 
 def _make_collector(data_query, api_key=None):
@@ -54,3 +55,34 @@ class TestSemanticScholarURLConstruction:
             url_page2 = url.format(100)
             assert url_page1 != url_page2
             assert "offset=0" in url_page1 or "0" in url_page1
+
+
+class TestSemanticScholarHeaders:
+    """Verify the API key header is built once and sent with every call."""
+
+    def setup_method(self):
+        self.data_query = {
+            "year": 2024,
+            "keyword": ["machine learning"],
+            "id_collect": 0,
+            "total_art": 0,
+            "last_page": 0,
+            "coll_art": 0,
+            "state": -1,
+        }
+
+    def _call_headers(self, collector):
+        with patch.object(API_collector, "api_call_decorator") as parent_call:
+            collector.api_call_decorator("https://example.org")
+            collector.api_call_decorator("https://example.org")
+        return [call.kwargs["headers"] for call in parent_call.call_args_list]
+
+    def test_api_key_header_reused(self):
+        collector = _make_collector(self.data_query, api_key="secret")
+        first, second = self._call_headers(collector)
+        assert first == {"x-api-key": "secret"}
+        assert first is second
+
+    def test_no_headers_without_api_key(self):
+        collector = _make_collector(self.data_query)
+        assert self._call_headers(collector) == [None, None]